@@ -19,18 +19,24 @@ Commercial licensing: keith@thenewfaithchurch.org
 """
 
 import numpy as np
+import asyncio
+import os
 import json
 import time
+import sys
 import logging
 import hashlib
 import threading
-import queue
 import weakref
+import queue
+import zlib
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, Callable
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
-from collections import deque, defaultdict
+from abc import ABC, abstractmethod
+from collections import deque, defaultdict, OrderedDict
+from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import multiprocessing as mp
 
@@ -59,17 +65,38 @@ class LFMConfig:
     """System configuration parameters"""
     # Scale parameters
     k_anchor: int = 66  # Nuclear scale anchor point
+    k_min: int = 0  # Supported scale range for precomputed tables
+    k_max: int = 204
     P_0: float = 5.44e71  # Planck pressure (Pa)
     L_p: float = 1.616e-35  # Planck length (m)
     c: float = 2.998e8  # Speed of light (m/s)
     
     # Neural architecture
+    pattern_library_path: Optional[str] = None  # JSON/TSV domain keywords
     tier1_cache_size: int = 10000
-    tier2_buffer_size: int = 1000
+    tier1_cache_policy: str = 'lru'  # 'lru', 'lfu' or 'ttl'
+    tier1_cache_ttl: float = 300.0  # Entry lifetime for 'ttl' policy (s)
+    tier1_key_strategy: str = 'str'  # 'str', 'hash64' or 'blake2'
+    tier1_prefilter: bool = False  # Skip the matcher when no keyword anchor occurs
+    tier2_buffer_size: int = 1000  # Decision history / stability window
+    tier2_history_spill_path: Optional[str] = None  # Append evicted decisions here
     batch_size: int = 100
     
+    # Reproducibility
+    seed: Optional[int] = None  # Root of every RNG stream; None draws OS entropy
+    
+    # Large-field symmetry: fields with at least this many elements are
+    # measured in row blocks instead of through a full rotated copy
+    symmetry_tile_min_size: int = 1 << 22
+    symmetry_block_rows: int = 256
+    
     # Performance tuning
     num_workers: int = mp.cpu_count()
+    execution_engine: str = 'thread'  # 'thread' or 'process' (sharded tier 1)
+    shard_report_interval: int = 10  # Iterations per shard counter report
+    async_max_pending: int = 1024  # Concurrent reasoning requests (async front-end)
+    async_reasoning_workers: int = 4  # Threads for offloaded executive reasoning
+    async_acquire_timeout: Optional[float] = None  # Wait for a slot; None waits forever
     training_iterations: int = 1000
     critical_pause: float = 0.01  # Pause for quality reasoning
     
@@ -82,38 +109,220 @@ class LFMConfig:
     max_operations: int = 100_000_000  # 100 million ops
     timeout_seconds: int = 120
     memory_limit_gb: int = 8
+    
+    # Bumped on every field assignment so derived tables can check
+    # staleness with a single integer compare
+    version = 0
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, 'version', self.version + 1)
+
+# =============================================================================
+# CONCURRENCY PRIMITIVES
+# =============================================================================
+
+class _CellOwner:
+    """Per-thread sentinel; collected when its thread exits"""
+    __slots__ = ('__weakref__',)
+
+def _retire_cell(counters_ref: 'weakref.ref', key: int) -> None:
+    """Fold a dead thread's cell into the retired totals"""
+    counters = counters_ref()
+    if counters is None:
+        return
+    with counters._lock:
+        cell = counters._cells.pop(key, None)
+        if cell is not None:
+            counters._retired = [a + b for a, b in zip(counters._retired, cell)]
+
+class StripedCounters(Mapping):
+    """
+    Fixed set of named counters with one cell per thread, merged on read
+    Each cell has a single writer, so increments are exact without a lock.
+    Cells of exited threads are folded into a retired total, so reads
+    cost O(live threads). Reads as a mapping of the non-zero counters;
+    len() and iteration use per-counter seen flags, not a merged read.
+    """
+    
+    def __init__(self, names: List[str]):
+        self.names = tuple(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self._local = threading.local()
+        self._cells: Dict[int, List[int]] = {}
+        self._retired = [0] * len(self.names)
+        self._seen = [False] * len(self.names)  # Set on a counter's first non-zero increment
+        self._seen_count = 0
+        self._lock = threading.Lock()  # Guards registration, retirement, reads and seen flags
+    
+    def _register(self) -> List[int]:
+        """Create and register the calling thread's cell"""
+        cell = [0] * len(self.names)
+        owner = _CellOwner()
+        with self._lock:
+            self._cells[id(cell)] = cell
+        weakref.finalize(owner, _retire_cell, weakref.ref(self), id(cell))
+        self._local.cell = cell
+        self._local.owner = owner
+        return cell
+    
+    def _mark_seen(self, i: int) -> None:
+        with self._lock:
+            if not self._seen[i]:
+                self._seen[i] = True
+                self._seen_count += 1
+    
+    def incr(self, name: str, n: int = 1) -> None:
+        i = self.index[name]
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._register()
+        cell[i] += n
+        if n and not self._seen[i]:
+            self._mark_seen(i)
+    
+    def incr_at(self, i: int, n: int = 1) -> None:
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._register()
+        cell[i] += n
+        if n and not self._seen[i]:
+            self._mark_seen(i)
+    
+    def incr_many(self, indices: Tuple[int, ...], n: int = 1) -> None:
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._register()
+        seen = self._seen
+        for i in indices:
+            cell[i] += n
+            if n and not seen[i]:
+                self._mark_seen(i)
+    
+    def value(self, name: str) -> int:
+        i = self.index[name]
+        with self._lock:
+            return self._retired[i] + sum(cell[i] for cell in self._cells.values())
+    
+    def snapshot(self) -> Dict[str, int]:
+        """All counters, including zeros"""
+        with self._lock:
+            totals = list(self._retired)
+            for cell in self._cells.values():
+                totals = [a + b for a, b in zip(totals, cell)]
+        return dict(zip(self.names, totals))
+    
+    def __getitem__(self, name: str) -> int:
+        return self.value(name)
+    
+    def __iter__(self):
+        return (name for name, seen in zip(self.names, self._seen) if seen)
+    
+    def __len__(self) -> int:
+        return self._seen_count
 
 # =============================================================================
 # PHYSICS FOUNDATION - 6 Core Axioms
 # =============================================================================
 
+class EntropyAccumulator:
+    """
+    Streaming Shannon entropy of |x| + eps, fed one chunk at a time
+    Keeps S = sum(a) and T = sum(a * log a) in float64, so that
+    H = log S - T / S without ever normalising the full array.
+    """
+    
+    def __init__(self, eps: float = 1e-10, block_size: int = 1 << 20):
+        self.eps = eps
+        self.block_size = block_size  # Bounds float64 temporaries per update
+        self.count = 0
+        self.nonzero = 0
+        self.total = 0.0
+        self.total_log = 0.0
+    
+    def update(self, chunk: np.ndarray) -> 'EntropyAccumulator':
+        flat = np.asarray(chunk).reshape(-1)
+        for start in range(0, flat.size, self.block_size):
+            a = np.abs(flat[start:start + self.block_size], dtype=np.float64)
+            if self.eps:
+                a += self.eps
+            log_a = np.zeros_like(a)
+            np.log(a, out=log_a, where=a > 0)  # 0 * log 0 = 0
+            self.count += a.size
+            self.nonzero += int(np.count_nonzero(a))
+            self.total += float(a.sum())
+            self.total_log += float(np.dot(a, log_a))
+        return self
+    
+    def merge(self, other: 'EntropyAccumulator') -> 'EntropyAccumulator':
+        """Fold in a partial result computed elsewhere, e.g. by a worker"""
+        if other.eps != self.eps:
+            raise ValueError(f"Cannot merge accumulators with eps {self.eps} and {other.eps}")
+        self.count += other.count
+        self.nonzero += other.nonzero
+        self.total += other.total
+        self.total_log += other.total_log
+        return self
+    
+    def entropy(self) -> float:
+        if self.total <= 0:
+            return 0.0
+        return float(np.log(self.total) - self.total_log / self.total)
+
+def _iter_chunks(data: Any, chunk_size: int):
+    """Flat chunks of an array (or memmap), or pass an iterable of chunks through"""
+    if isinstance(data, np.ndarray):
+        flat = data.reshape(-1)
+        for start in range(0, flat.size, chunk_size):
+            yield flat[start:start + chunk_size]
+    else:
+        yield from data
+
 class PhysicsAxioms:
     """Six foundational physics axioms of LFM"""
     
+    H_BAR = 1.055e-34  # Reduced Planck constant
+    
     def __init__(self, config: LFMConfig):
         self.config = config
-        self.axiom_calls = defaultdict(int)
+        self.axiom_calls = StripedCounters(
+            ['conservation', 'entropy', 'symmetry', 'relativity', 'uncertainty', 'emergence']
+        )
+        self._local = threading.local()  # Per-thread scratch buffers
     
     def conservation(self, initial_state: np.ndarray, final_state: np.ndarray) -> bool:
         """AXIOM 1: Energy-momentum conservation"""
-        self.axiom_calls['conservation'] += 1
+        self.axiom_calls.incr('conservation')
         total_initial = np.sum(initial_state)
         total_final = np.sum(final_state)
         return abs(total_initial - total_final) < 1e-10
     
     def entropy(self, state: np.ndarray) -> float:
         """AXIOM 2: Entropy always increases"""
-        self.axiom_calls['entropy'] += 1
+        self.axiom_calls.incr('entropy')
         # Calculate Shannon entropy
         state = np.abs(state) + 1e-10  # Avoid log(0)
         state_norm = state / np.sum(state)
         entropy = -np.sum(state_norm * np.log(state_norm))
         return entropy
     
+    def entropy_stream(self, chunks: Any, chunk_size: int = 1 << 20) -> float:
+        """AXIOM 2 over a memmap or an iterable of chunks, same result as entropy()"""
+        self.axiom_calls.incr('entropy')
+        acc = EntropyAccumulator(eps=1e-10)
+        for chunk in _iter_chunks(chunks, chunk_size):
+            acc.update(chunk)
+        return acc.entropy()
+    
     def symmetry(self, field: np.ndarray) -> Tuple[bool, float]:
         """AXIOM 3: Physical laws exhibit symmetry"""
-        self.axiom_calls['symmetry'] += 1
+        self.axiom_calls.incr('symmetry')
         # Check rotational symmetry
+        if field.ndim == 2 and field.size >= self.config.symmetry_tile_min_size:
+            return self._symmetry_blocks(field, 0.1, self.config.symmetry_block_rows, False)
         if field.ndim == 2:
             rotated = np.rot90(field)
             symmetry_measure = np.mean(np.abs(field - rotated))
@@ -121,9 +330,54 @@ class PhysicsAxioms:
             return is_symmetric, symmetry_measure
         return True, 0.0
     
+    def symmetry_tiled(self, field: np.ndarray, threshold: float = 0.1,
+                       block_rows: Optional[int] = None, early_exit: bool = False) -> Tuple[bool, float]:
+        """
+        AXIOM 3 streamed over row blocks of a large 2-D field
+        Works on float32 and memmapped fields without a full rotated copy.
+        With early_exit the scan stops once the threshold is certainly
+        exceeded and the measure returned is a lower bound.
+        """
+        self.axiom_calls.incr('symmetry')
+        if field.ndim != 2:
+            return True, 0.0
+        return self._symmetry_blocks(field, threshold, block_rows or self.config.symmetry_block_rows, early_exit)
+    
+    def _symmetry_blocks(self, field: np.ndarray, threshold: float, block_rows: int,
+                         early_exit: bool) -> Tuple[bool, float]:
+        H, W = field.shape
+        if H != W:
+            raise ValueError(f"Rotational symmetry needs a square field, got {H}x{W}")
+        
+        scratch = self._scratch(block_rows, W, np.result_type(field.dtype, np.float32))
+        limit = threshold * field.size
+        total = 0.0
+        
+        for r0 in range(0, H, block_rows):
+            r1 = min(r0 + block_rows, H)
+            block = scratch[:r1 - r0]
+            # Rows r0:r1 of rot90(field) are columns W-1-r0 .. W-r1 of field
+            rotated_rows = field[:, W - r1:W - r0][:, ::-1].T
+            np.subtract(field[r0:r1], rotated_rows, out=block)
+            np.abs(block, out=block)
+            total += float(block.sum(dtype=np.float64))
+            if early_exit and total >= limit:
+                return False, total / field.size
+        
+        symmetry_measure = total / field.size
+        return symmetry_measure < threshold, symmetry_measure
+    
+    def _scratch(self, rows: int, cols: int, dtype: Any) -> np.ndarray:
+        """Per-thread scratch buffer, reused while the block shape fits"""
+        buf = getattr(self._local, 'scratch', None)
+        if buf is None or buf.dtype != dtype or buf.shape[1] != cols or buf.shape[0] < rows:
+            buf = np.empty((rows, cols), dtype=dtype)
+            self._local.scratch = buf
+        return buf[:rows]
+    
     def relativity(self, event: Dict, frame: str = 'rest') -> Dict:
         """AXIOM 4: Space-time relativity"""
-        self.axiom_calls['relativity'] += 1
+        self.axiom_calls.incr('relativity')
         # Transform event to specified frame
         if frame == 'moving':
             gamma = 1.0 / np.sqrt(1 - (event.get('v', 0) / self.config.c)**2)
@@ -133,15 +387,89 @@ class PhysicsAxioms:
     
     def uncertainty(self, position: float, momentum: float) -> float:
         """AXIOM 5: Heisenberg uncertainty principle"""
-        self.axiom_calls['uncertainty'] += 1
-        h_bar = 1.055e-34  # Reduced Planck constant
+        self.axiom_calls.incr('uncertainty')
         uncertainty_product = position * momentum
-        minimum_uncertainty = h_bar / 2
+        minimum_uncertainty = self.H_BAR / 2
         return max(uncertainty_product, minimum_uncertainty)
     
+    # Batch variants: one row per state, one counter update per batch
+    
+    def conservation_batch(self, initial_states: np.ndarray, final_states: np.ndarray) -> np.ndarray:
+        """AXIOM 1 over (N, d) stacked states"""
+        initial_states = np.asarray(initial_states)
+        self.axiom_calls.incr('conservation', len(initial_states))
+        total_initial = np.sum(initial_states, axis=1)
+        total_final = np.sum(final_states, axis=1)
+        return np.abs(total_initial - total_final) < 1e-10
+    
+    def entropy_batch(self, states: np.ndarray) -> np.ndarray:
+        """AXIOM 2 over (N, d) stacked states"""
+        states = np.abs(states) + 1e-10  # Avoid log(0)
+        self.axiom_calls.incr('entropy', len(states))
+        states_norm = states / np.sum(states, axis=1, keepdims=True)
+        return -np.sum(states_norm * np.log(states_norm), axis=1)
+    
+    def symmetry_batch(self, fields: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """AXIOM 3 over (N, H, W) stacked 2-D fields"""
+        fields = np.asarray(fields)
+        self.axiom_calls.incr('symmetry', len(fields))
+        rotated = np.rot90(fields, axes=(1, 2))
+        symmetry_measure = np.mean(np.abs(fields - rotated), axis=(1, 2))
+        return symmetry_measure < 0.1, symmetry_measure
+    
+    def relativity_batch(self, events: Any, frame: str = 'rest') -> Dict[str, np.ndarray]:
+        """
+        AXIOM 4 over an event table: a structured array or dict of columns
+        with t, x and v. Inputs are read in place and never modified; the
+        transformed coordinates come back as new columns.
+        """
+        t = np.asarray(events['t'])
+        x = np.asarray(events['x'])
+        self.axiom_calls.incr('relativity', t.size)
+        
+        names = events.dtype.names if isinstance(events, np.ndarray) else events
+        v = np.asarray(events['v']) if 'v' in names else None
+        shape = np.broadcast(t, x).shape if v is None else np.broadcast(t, x, v).shape
+        
+        if frame != 'moving':
+            # Rest frame: coordinates are unchanged, returned as read-only
+            # float64 views of the broadcast shape (copied only to convert)
+            return {
+                'gamma': np.ones(shape),
+                't_prime': np.broadcast_to(t.astype(np.float64, copy=False), shape),
+                'x_prime': np.broadcast_to(x.astype(np.float64, copy=False), shape)
+            }
+        
+        c = self.config.c
+        
+        # Same operation order as relativity(), computed in place in float64
+        # buffers so integer columns and scalar v behave like the scalar axiom
+        gamma = np.divide(v, c, out=np.empty(shape), dtype=np.float64)
+        gamma *= gamma
+        np.subtract(1, gamma, out=gamma)
+        np.sqrt(gamma, out=gamma)
+        np.divide(1.0, gamma, out=gamma)
+        
+        t_prime = np.multiply(x, v, out=np.empty(shape), dtype=np.float64)
+        t_prime /= c**2
+        np.subtract(t, t_prime, out=t_prime)
+        t_prime *= gamma
+        
+        x_prime = np.multiply(v, t, out=np.empty(shape), dtype=np.float64)
+        np.subtract(x, x_prime, out=x_prime)
+        x_prime *= gamma
+        
+        return {'gamma': gamma, 't_prime': t_prime, 'x_prime': x_prime}
+    
+    def uncertainty_batch(self, position: np.ndarray, momentum: np.ndarray) -> np.ndarray:
+        """AXIOM 5 over arrays of positions and momenta"""
+        uncertainty_product = np.multiply(position, momentum)
+        self.axiom_calls.incr('uncertainty', uncertainty_product.size)
+        return np.maximum(uncertainty_product, self.H_BAR / 2)
+    
     def emergence(self, components: List[Any]) -> Any:
         """AXIOM 6: Complex properties emerge from simple components"""
-        self.axiom_calls['emergence'] += 1
+        self.axiom_calls.incr('emergence')
         # Emergence manifests as non-linear combination
         if len(components) > 1:
             emergent = sum(components) + 0.1 * len(components)**2
@@ -152,12 +480,24 @@ class PhysicsAxioms:
 # AI STABILITY - 18 Additional Axioms
 # =============================================================================
 
+AI_AXIOM_NAMES = (
+    'pattern_recognition', 'causality', 'feedback_loops', 'optimization', 'adaptation',
+    'stability', 'information', 'complexity', 'hierarchy', 'scaling', 'emergence_ai',
+    'nonlinearity', 'path_dependence', 'network_effects', 'resilience',
+    'self_organization', 'phase_transitions', 'universality'
+)
+
+# Counter indices into AIStabilityAxioms.axiom_applications
+(_IDX_PATTERN_RECOGNITION, _IDX_CAUSALITY, _IDX_FEEDBACK_LOOPS, _IDX_OPTIMIZATION,
+    _IDX_ADAPTATION, _IDX_STABILITY, _IDX_INFORMATION, _IDX_COMPLEXITY, _IDX_HIERARCHY,
+    _IDX_SCALING, _IDX_EMERGENCE_AI, _IDX_NONLINEARITY, _IDX_PATH_DEPENDENCE,
+    _IDX_NETWORK_EFFECTS, _IDX_RESILIENCE, _IDX_SELF_ORGANIZATION,
+    _IDX_PHASE_TRANSITIONS, _IDX_UNIVERSALITY) = range(len(AI_AXIOM_NAMES))
+
 class AIStabilityAxioms:
     """18 AI stability axioms for robust reasoning"""
     
     def __init__(self):
-        self.axiom_applications = defaultdict(int)
-        
         self.axioms = {
             'pattern_recognition': self.pattern_recognition,
             'causality': self.causality,
@@ -178,10 +518,21 @@ class AIStabilityAxioms:
             'phase_transitions': self.phase_transitions,
             'universality': self.universality
         }
+        self.axiom_applications = StripedCounters(AI_AXIOM_NAMES)
+        self.pipelines: Dict[str, 'AxiomPipeline'] = {}
+    
+    def compile_pipeline(self, name: str, steps: List[Tuple[str, str, Callable]]) -> 'AxiomPipeline':
+        """Compile and register a named pipeline, see AxiomPipeline"""
+        pipeline = AxiomPipeline(self, steps)
+        self.pipelines[name] = pipeline
+        return pipeline
     
     def pattern_recognition(self, data: np.ndarray) -> Dict:
         """AXIOM 7: Patterns reveal structure"""
-        self.axiom_applications['pattern_recognition'] += 1
+        self.axiom_applications.incr_at(_IDX_PATTERN_RECOGNITION)
+        return self._pattern_recognition(data)
+    
+    def _pattern_recognition(self, data: np.ndarray) -> Dict:
         # FFT to find frequency patterns
         if data.size > 0:
             fft = np.fft.fft(data.flatten())
@@ -191,7 +542,10 @@ class AIStabilityAxioms:
     
     def causality(self, cause: Any, effect: Any) -> float:
         """AXIOM 8: Every effect has a cause"""
-        self.axiom_applications['causality'] += 1
+        self.axiom_applications.incr_at(_IDX_CAUSALITY)
+        return self._causality(cause, effect)
+    
+    def _causality(self, cause: Any, effect: Any) -> float:
         # Simple correlation as causality proxy
         if isinstance(cause, np.ndarray) and isinstance(effect, np.ndarray):
             if cause.size == effect.size:
@@ -201,30 +555,52 @@ class AIStabilityAxioms:
     
     def feedback_loops(self, state: float, feedback: float, gain: float = 0.1) -> float:
         """AXIOM 9: Self-regulation through feedback"""
-        self.axiom_applications['feedback_loops'] += 1
+        self.axiom_applications.incr_at(_IDX_FEEDBACK_LOOPS)
+        return self._feedback_loops(state, feedback, gain)
+    
+    def _feedback_loops(self, state: float, feedback: float, gain: float = 0.1) -> float:
         return state + gain * feedback
     
     def optimization(self, values: List[float]) -> float:
         """AXIOM 10: Natural optimization for efficiency"""
-        self.axiom_applications['optimization'] += 1
+        self.axiom_applications.incr_at(_IDX_OPTIMIZATION)
+        return self._optimization(values)
+    
+    def _optimization(self, values: List[float]) -> float:
         return min(values) if values else 0
     
     def adaptation(self, error: float, learning_rate: float = 0.1) -> float:
         """AXIOM 11: Adaptive response to change"""
-        self.axiom_applications['adaptation'] += 1
+        self.axiom_applications.incr_at(_IDX_ADAPTATION)
+        return self._adaptation(error, learning_rate)
+    
+    def _adaptation(self, error: float, learning_rate: float = 0.1) -> float:
         return -learning_rate * error
     
     def stability(self, trajectory: np.ndarray) -> bool:
         """AXIOM 12: Stable patterns persist"""
-        self.axiom_applications['stability'] += 1
+        self.axiom_applications.incr_at(_IDX_STABILITY)
+        return self._stability(trajectory)
+    
+    def _stability(self, trajectory: np.ndarray) -> bool:
         if len(trajectory) > 1:
             variance = np.var(trajectory)
             return variance < 1.0
         return True
     
+    def stability_moments(self, count: int, variance: float) -> bool:
+        """AXIOM 12 from a trajectory's running length and variance"""
+        self.axiom_applications.incr_at(_IDX_STABILITY)
+        if count > 1:
+            return variance < 1.0
+        return True
+    
     def information_reduction(self, data: np.ndarray) -> float:
         """AXIOM 13: Information reduces uncertainty"""
-        self.axiom_applications['information'] += 1
+        self.axiom_applications.incr_at(_IDX_INFORMATION)
+        return self._information_reduction(data)
+    
+    def _information_reduction(self, data: np.ndarray) -> float:
         # Entropy as information measure
         if data.size > 0:
             data_norm = np.abs(data) / (np.sum(np.abs(data)) + 1e-10)
@@ -232,64 +608,230 @@ class AIStabilityAxioms:
             return 1.0 / (1.0 + entropy)
         return 0
     
+    def information_reduction_stream(self, chunks: Any, chunk_size: int = 1 << 20) -> float:
+        """AXIOM 13 over a memmap or an iterable of chunks"""
+        self.axiom_applications.incr_at(_IDX_INFORMATION)
+        acc = EntropyAccumulator(eps=0.0)
+        for chunk in _iter_chunks(chunks, chunk_size):
+            acc.update(chunk)
+        return self.information_from(acc)
+    
+    @staticmethod
+    def information_from(acc: 'EntropyAccumulator') -> float:
+        """
+        information_reduction() from accumulated sums (eps=0)
+        The 1e-10 pads are folded in exactly for the normaliser and to
+        first order for the log, which shifts entropy by -1e-10 per non-zero.
+        """
+        if acc.count == 0:
+            return 0
+        S = acc.total + 1e-10
+        entropy = (acc.total / S) * np.log(S) - acc.total_log / S - 1e-10 * acc.nonzero
+        return float(1.0 / (1.0 + entropy))
+    
     def complexity_emergence(self, elements: int) -> float:
         """AXIOM 14: Complexity from simple rules"""
-        self.axiom_applications['complexity'] += 1
+        self.axiom_applications.incr_at(_IDX_COMPLEXITY)
+        return self._complexity_emergence(elements)
+    
+    def _complexity_emergence(self, elements: int) -> float:
         return elements * np.log(elements + 1)
     
     def hierarchical_organization(self, levels: List[int]) -> int:
         """AXIOM 15: Hierarchical structure"""
-        self.axiom_applications['hierarchy'] += 1
+        self.axiom_applications.incr_at(_IDX_HIERARCHY)
+        return self._hierarchical_organization(levels)
+    
+    def _hierarchical_organization(self, levels: List[int]) -> int:
         return len(levels)
     
     def scaling_invariance(self, value: float, scale: float) -> float:
         """AXIOM 16: Principles scale across sizes"""
-        self.axiom_applications['scaling'] += 1
+        self.axiom_applications.incr_at(_IDX_SCALING)
+        return self._scaling_invariance(value, scale)
+    
+    def _scaling_invariance(self, value: float, scale: float) -> float:
         return value * scale
     
     def ai_emergence(self, components: int) -> float:
         """AXIOM 17: New properties at higher levels"""
-        self.axiom_applications['emergence_ai'] += 1
+        self.axiom_applications.incr_at(_IDX_EMERGENCE_AI)
+        return self._ai_emergence(components)
+    
+    def _ai_emergence(self, components: int) -> float:
         return components**1.5
     
     def nonlinearity(self, input_val: float) -> float:
         """AXIOM 18: Small changes, large effects"""
-        self.axiom_applications['nonlinearity'] += 1
+        self.axiom_applications.incr_at(_IDX_NONLINEARITY)
+        return self._nonlinearity(input_val)
+    
+    def _nonlinearity(self, input_val: float) -> float:
         return input_val**3 - input_val
     
     def path_dependence(self, history: List[float]) -> float:
         """AXIOM 19: History affects future"""
-        self.axiom_applications['path_dependence'] += 1
+        self.axiom_applications.incr_at(_IDX_PATH_DEPENDENCE)
+        return self._path_dependence(history)
+    
+    def _path_dependence(self, history: List[float]) -> float:
         if history:
             return sum(h * (0.9 ** i) for i, h in enumerate(reversed(history)))
         return 0
     
     def network_effects(self, nodes: int) -> float:
         """AXIOM 20: Network amplification"""
-        self.axiom_applications['network_effects'] += 1
+        self.axiom_applications.incr_at(_IDX_NETWORK_EFFECTS)
+        return self._network_effects(nodes)
+    
+    def _network_effects(self, nodes: int) -> float:
         return nodes * (nodes - 1) / 2  # Metcalfe's law
     
     def resilience(self, perturbation: float, system_state: float) -> float:
         """AXIOM 21: Resilience to perturbations"""
-        self.axiom_applications['resilience'] += 1
+        self.axiom_applications.incr_at(_IDX_RESILIENCE)
+        return self._resilience(perturbation, system_state)
+    
+    def _resilience(self, perturbation: float, system_state: float) -> float:
         damping = 0.5
         return system_state - damping * perturbation
     
     def self_organization(self, entropy: float) -> float:
         """AXIOM 22: Spontaneous organization"""
-        self.axiom_applications['self_organization'] += 1
+        self.axiom_applications.incr_at(_IDX_SELF_ORGANIZATION)
+        return self._self_organization(entropy)
+    
+    def _self_organization(self, entropy: float) -> float:
         return 1.0 / (1.0 + entropy)
     
     def phase_transitions(self, parameter: float, critical_point: float = 1.0) -> str:
         """AXIOM 23: Abrupt changes at critical points"""
-        self.axiom_applications['phase_transitions'] += 1
+        self.axiom_applications.incr_at(_IDX_PHASE_TRANSITIONS)
+        return self._phase_transitions(parameter, critical_point)
+    
+    def _phase_transitions(self, parameter: float, critical_point: float = 1.0) -> str:
         return 'ordered' if parameter < critical_point else 'disordered'
     
     def universality(self) -> bool:
         """AXIOM 24: Same principles across domains"""
-        self.axiom_applications['universality'] += 1
+        self.axiom_applications.incr_at(_IDX_UNIVERSALITY)
+        return self._universality()
+    
+    def _universality(self) -> bool:
         return True
 
+class AxiomPipeline:
+    """
+    Chain of AI axioms compiled once and applied to whole batches
+    Each step is (result_key, axiom_name, extract), where extract(*record)
+    returns the axiom's arguments. Counters are bumped once per call.
+    """
+    
+    def __init__(self, ai: AIStabilityAxioms, steps: List[Tuple[str, str, Callable]]):
+        self.ai = ai
+        self.keys = tuple(key for key, _, _ in steps)
+        calls, indices = [], []
+        for key, name, extract in steps:
+            # Uncounted body of the axiom; counts are bumped per call below
+            calls.append((key, getattr(ai, '_' + ai.axioms[name].__name__), extract))
+            indices.append(AI_AXIOM_NAMES.index(name))
+        self._calls = tuple(calls)
+        self._indices = tuple(indices)
+    
+    def __call__(self, *record: Any) -> Dict[str, Any]:
+        self.ai.axiom_applications.incr_many(self._indices)
+        return {key: fn(*extract(*record)) for key, fn, extract in self._calls}
+    
+    def apply_batch(self, records: List[Tuple]) -> Dict[str, List[Any]]:
+        """Columns of results, one list per step"""
+        self.ai.axiom_applications.incr_many(self._indices, len(records))
+        return {key: [fn(*extract(*record)) for record in records]
+                for key, fn, extract in self._calls}
+
+# =============================================================================
+# OUT-OF-CORE SWEEP STORAGE
+# =============================================================================
+
+class MemmapSweep:
+    """
+    Structured numpy.memmap output with a resumable cursor
+    The cursor lives in a JSON sidecar and only advances after a chunk
+    is flushed, so an interrupted sweep resumes at the first unwritten row
+    """
+    
+    def __init__(self, filepath: str, dtype: Any, total: int, meta: Optional[Dict] = None):
+        self.filepath = filepath
+        self.cursor_path = filepath + '.cursor.json'
+        self.dtype = np.dtype(dtype)
+        self.total = total
+        self.meta = meta or {}
+        
+        state = self._read_cursor(self.cursor_path)
+        if state is not None and os.path.exists(filepath):
+            expected = (np.lib.format.dtype_to_descr(self.dtype), total, self.meta)
+            found = (self._descr(state['dtype']), state['total'], state['meta'])
+            if found != expected:
+                raise ValueError(f"{filepath} holds a different sweep; remove it to start over")
+            self.done = state['done']
+            mode = 'r+'
+        else:
+            self.done = 0
+            mode = 'w+'
+        
+        self.rows = np.memmap(filepath, dtype=self.dtype, mode=mode, shape=(total,))
+        if mode == 'w+':
+            self._write_cursor()
+    
+    @staticmethod
+    def _read_cursor(cursor_path: str) -> Optional[Dict]:
+        if not os.path.exists(cursor_path):
+            return None
+        with open(cursor_path) as f:
+            return json.load(f)
+    
+    @staticmethod
+    def _descr(descr: Any) -> Any:
+        """JSON turns descr tuples into lists; restore them for comparison"""
+        if isinstance(descr, list):
+            return [tuple(field) for field in descr]
+        return descr
+    
+    def _write_cursor(self) -> None:
+        state = {
+            'dtype': np.lib.format.dtype_to_descr(self.dtype),
+            'total': self.total,
+            'done': self.done,
+            'meta': self.meta
+        }
+        tmp_path = self.cursor_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.cursor_path)
+    
+    @property
+    def complete(self) -> bool:
+        return self.done >= self.total
+    
+    def pending_chunks(self, chunk_size: int):
+        """(start, stop) row ranges still to be written"""
+        for start in range(self.done, self.total, chunk_size):
+            yield start, min(start + chunk_size, self.total)
+    
+    def commit(self, stop: int) -> None:
+        """Flush rows written so far and advance the cursor to stop"""
+        self.rows.flush()
+        self.done = stop
+        self._write_cursor()
+    
+    @classmethod
+    def open(cls, filepath: str) -> np.memmap:
+        """Zero-copy, read-only view of a sweep file (complete or not)"""
+        state = cls._read_cursor(filepath + '.cursor.json')
+        if state is None:
+            raise FileNotFoundError(f"No sweep cursor for {filepath}")
+        dtype = np.lib.format.descr_to_dtype(cls._descr(state['dtype']))
+        return np.memmap(filepath, dtype=dtype, mode='r', shape=(state['total'],))
+
 # =============================================================================
 # RELATIONAL MATHEMATICS ENGINE
 # =============================================================================
@@ -299,14 +841,19 @@ class RelationalMathematics:
     
     def __init__(self, config: LFMConfig):
         self.config = config
-        self.operation_count = 0
+        self._counters = StripedCounters(['operations'])
+        self.rebuild_tables()
+    
+    @property
+    def operation_count(self) -> int:
+        return self._counters.value('operations')
     
     def relational_product(self, psi: float, tau: float, k: int = 66) -> Tuple[float, float]:
         """
         Core relational product ψ ⊗_k τ
         Non-commutative: ψ ⊗ τ ≠ τ ⊗ ψ
         """
-        self.operation_count += 1
+        self._counters.incr('operations')
         
         # Scale-dependent coupling
         kappa_k = self.coupling_strength(k)
@@ -317,25 +864,254 @@ class RelationalMathematics:
         
         return psi_op_tau, tau_op_psi
     
+    def relational_product_array(self, psi: Any, tau: Any, k: Any = 66,
+                                 out: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array-native ψ ⊗_k τ with NumPy broadcasting over psi, tau and k
+        Results are written into out=(psi_op_tau, tau_op_psi) when given
+        """
+        psi = np.asarray(psi, dtype=np.float64)
+        tau = np.asarray(tau, dtype=np.float64)
+        kappa = self.coupling_strength_array(k)
+        shape = np.broadcast_shapes(psi.shape, tau.shape, np.shape(kappa))
+        
+        if out is None:
+            out = (np.empty(shape), np.empty(shape))
+        elif any(buf.shape != shape for buf in out):
+            raise ValueError(f"out buffers must have the broadcast shape {shape}")
+        psi_op_tau, tau_op_psi = out
+        
+        # Same operation order as relational_product, so results match it
+        # exactly; only the psi * tau product needs a temporary
+        product = psi * tau
+        np.multiply(kappa, psi, out=psi_op_tau)
+        psi_op_tau += 1
+        psi_op_tau *= product
+        np.multiply(kappa, tau, out=tau_op_psi)
+        tau_op_psi += 1
+        tau_op_psi *= product
+        
+        self._counters.incr('operations', int(np.prod(shape)))
+        return psi_op_tau, tau_op_psi
+    
+    def rebuild_tables(self) -> None:
+        """Precompute scale lookups over the supported integer k range"""
+        c = self.config
+        k = np.arange(c.k_min, c.k_max + 1)
+        
+        self.k_table = k
+        self.pressure_table = self._pressure(k)
+        self.length_table = self._length(k)
+        self.field_table = self.length_table * np.sqrt(self.pressure_table)
+        self.coupling_table = self._coupling(k)
+        
+        # Python-float dicts keyed by integer k make a scalar lookup one
+        # dict probe; np.integer keys hash like the int they hold
+        keys = k.tolist()
+        self._pressure_map = dict(zip(keys, self.pressure_table.tolist()))
+        self._length_map = dict(zip(keys, self.length_table.tolist()))
+        self._field_map = dict(zip(keys, self.field_table.tolist()))
+        self._coupling_map = dict(zip(keys, self.coupling_table.tolist()))
+        self._k_min = c.k_min
+        self._table_version = c.version
+    
+    def _pressure(self, k: np.ndarray) -> np.ndarray:
+        return self.config.P_0 * np.power(4.0, -np.asarray(k, dtype=np.float64))
+    
+    def _length(self, k: np.ndarray) -> np.ndarray:
+        return self.config.L_p * np.power(2.0, np.asarray(k, dtype=np.float64))
+    
+    def _coupling(self, k: np.ndarray) -> np.ndarray:
+        return 1.0 / (1.0 + 0.1 * np.abs(np.asarray(k, dtype=np.float64) - self.config.k_anchor))
+    
+    def _field(self, k: np.ndarray) -> np.ndarray:
+        return self._length(k) * np.sqrt(self._pressure(k))
+    
+    def _lookup(self, name: str, compute, k: Any) -> np.ndarray:
+        """Gather from a table for in-range integer k, compute everything else"""
+        if self.config.version != self._table_version:
+            self.rebuild_tables()
+        table = getattr(self, name)
+        k = np.asarray(k)
+        if k.dtype.kind not in 'iu':
+            return compute(k)
+        
+        idx = k - self._k_min
+        inside = (idx >= 0) & (idx < len(table))
+        if inside.all():
+            return table[idx]
+        out = compute(k)
+        out[inside] = table[idx[inside]]
+        return out
+    
+    def sweep_constants(self) -> Dict[str, float]:
+        """Physics constants a stored sweep depends on, for MemmapSweep meta"""
+        c = self.config
+        return {'P_0': float(c.P_0), 'L_p': float(c.L_p), 'k_anchor': float(c.k_anchor)}
+    
+    def relational_product_to_memmap(self, filepath: str, psi: Any, tau: Any, k: Any,
+                                     chunk_size: int = 1_000_000) -> np.memmap:
+        """
+        Stream ψ ⊗_k τ over the full psi × tau × k grid into a memmap file
+        Rows are (psi, tau, k, psi_op_tau, tau_op_psi) in C order; rerunning
+        with the same grids and constants resumes an interrupted sweep
+        """
+        grids = [np.ravel(np.asarray(g, dtype=np.float64)) for g in (psi, tau, k)]
+        shape = tuple(len(g) for g in grids)
+        meta = {
+            'kind': 'relational_product',
+            'shape': list(shape),
+            'grids': hashlib.blake2b(b''.join(g.tobytes() for g in grids), digest_size=8).hexdigest(),
+            'dtype': 'float64',
+            **self.sweep_constants()
+        }
+        dtype = [(name, np.float64) for name in ('psi', 'tau', 'k', 'psi_op_tau', 'tau_op_psi')]
+        sweep = MemmapSweep(filepath, dtype, int(np.prod(shape)), meta)
+        
+        for start, stop in sweep.pending_chunks(chunk_size):
+            rows = sweep.rows[start:stop]
+            i, j, l = np.unravel_index(np.arange(start, stop), shape)
+            rows['psi'] = grids[0][i]
+            rows['tau'] = grids[1][j]
+            rows['k'] = grids[2][l]
+            self.relational_product_array(
+                rows['psi'], rows['tau'], rows['k'],
+                out=(rows['psi_op_tau'], rows['tau_op_psi'])
+            )
+            sweep.commit(stop)
+        
+        return MemmapSweep.open(filepath)
+    
     def coupling_strength(self, k: int) -> float:
         """Scale-dependent coupling κ_k"""
         # Coupling weakens at larger scales
+        if self.config.version != self._table_version:
+            self.rebuild_tables()
+        value = self._coupling_map.get(k)
+        if value is not None:
+            return value
         return 1.0 / (1.0 + 0.1 * abs(k - self.config.k_anchor))
     
     def pressure_scale(self, k: int) -> float:
         """Universal pressure scaling P_k = P_0 × 4^(-k)"""
-        return self.config.P_0 * (4 ** (-k))
+        if self.config.version != self._table_version:
+            self.rebuild_tables()
+        value = self._pressure_map.get(k)
+        if value is not None:
+            return value
+        # Float power: underflows to 0 instead of building 4**k exactly
+        return self._pressure(k)[()]
     
     def length_scale(self, k: int) -> float:
         """Length scaling L_k = L_p × 2^k"""
-        return self.config.L_p * (2 ** k)
+        if self.config.version != self._table_version:
+            self.rebuild_tables()
+        value = self._length_map.get(k)
+        if value is not None:
+            return value
+        # Float power: overflows to inf instead of raising on huge 2**k
+        return self._length(k)[()]
     
     def field_amplitude(self, k: int) -> float:
         """Field amplitude unit Ψ_unit = L_k × √P_k"""
+        if self.config.version != self._table_version:
+            self.rebuild_tables()
+        value = self._field_map.get(k)
+        if value is not None:
+            return value
         L_k = self.length_scale(k)
         P_k = self.pressure_scale(k)
         return L_k * np.sqrt(P_k)
     
+    def coupling_strength_array(self, k: Any) -> np.ndarray:
+        """Vectorized κ_k"""
+        return self._lookup('coupling_table', self._coupling, k)
+    
+    def pressure_scale_array(self, k: Any) -> np.ndarray:
+        """Vectorized P_k"""
+        return self._lookup('pressure_table', self._pressure, k)
+    
+    def length_scale_array(self, k: Any) -> np.ndarray:
+        """Vectorized L_k"""
+        return self._lookup('length_table', self._length, k)
+    
+    def field_amplitude_array(self, k: Any) -> np.ndarray:
+        """Vectorized Ψ_unit"""
+        return self._lookup('field_table', self._field, k)
+    
+    # Log-space representation: log_b(P_k) = log_b(P_0) - k log_b(4) etc.
+    # stays finite for any k, at a constant cost per element
+    
+    @staticmethod
+    def _log_fn(base: float):
+        if base == 10:
+            return np.log10
+        if base == np.e:
+            return np.log
+        return lambda x: np.log(x) / np.log(base)
+    
+    def log_pressure_scale(self, k: Any, base: float = 10, dtype: Any = np.float64) -> Any:
+        """log_b P_k, scalar or vectorized over k"""
+        log = self._log_fn(base)
+        return log(dtype(self.config.P_0)) - np.asarray(k, dtype=dtype) * log(dtype(4))
+    
+    def log_length_scale(self, k: Any, base: float = 10, dtype: Any = np.float64) -> Any:
+        """log_b L_k, scalar or vectorized over k"""
+        log = self._log_fn(base)
+        return log(dtype(self.config.L_p)) + np.asarray(k, dtype=dtype) * log(dtype(2))
+    
+    def log_field_amplitude(self, k: Any, base: float = 10, dtype: Any = np.float64) -> Any:
+        """log_b Ψ_unit = log_b L_k + ½ log_b P_k"""
+        return (self.log_length_scale(k, base, dtype)
+                + 0.5 * self.log_pressure_scale(k, base, dtype))
+    
+    def to_log(self, value: Any, base: float = 10) -> Any:
+        """Linear quantity to log_b representation"""
+        return self._log_fn(base)(np.asarray(value, dtype=np.float64))
+    
+    def from_log(self, log_value: Any, base: float = 10) -> Any:
+        """log_b representation back to linear (inf/0 beyond float range)"""
+        with np.errstate(over='ignore', under='ignore'):
+            return np.power(np.float64(base), log_value)
+    
+    def log_nondimensionalize(self, log_value: Any, k: Any, quantity_type: str, base: float = 10) -> Any:
+        """nondimensionalize() on log_b values: a subtraction instead of a division"""
+        if quantity_type == 'length':
+            return log_value - self.log_length_scale(k, base)
+        elif quantity_type == 'pressure':
+            return log_value - self.log_pressure_scale(k, base)
+        elif quantity_type == 'field':
+            return log_value - self.log_field_amplitude(k, base)
+        else:
+            return log_value
+    
+    def scale_columns(self, k: Any, dtype: Any = np.float64, log_space: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Pressure, length and field amplitude for an array of (possibly
+        fractional) k. dtype=np.longdouble widens the range before
+        under/overflow; log_space returns log10 columns that never do.
+        """
+        k = np.asarray(k)
+        
+        if log_space:
+            return {
+                'log10_pressure_Pa': self.log_pressure_scale(k, dtype=dtype),
+                'log10_length_m': self.log_length_scale(k, dtype=dtype),
+                'log10_field_amplitude': self.log_field_amplitude(k, dtype=dtype)
+            }
+        
+        if np.dtype(dtype) == np.float64:
+            pressure = self.pressure_scale_array(k)
+            length = self.length_scale_array(k)
+            field_amp = self.field_amplitude_array(k)
+        else:
+            kk = k.astype(dtype)
+            pressure = dtype(self.config.P_0) * np.power(dtype(4), -kk)
+            length = dtype(self.config.L_p) * np.power(dtype(2), kk)
+            field_amp = length * np.sqrt(pressure)
+        
+        return {'pressure_Pa': pressure, 'length_m': length, 'field_amplitude': field_amp}
+    
     def nondimensionalize(self, value: float, k: int, quantity_type: str) -> float:
         """Convert physical quantities to dimensionless form"""
         if quantity_type == 'length':
@@ -347,6 +1123,608 @@ class RelationalMathematics:
         else:
             return value
 
+# =============================================================================
+# TIER 1 SUPPLY CACHE - Bounded eviction policies
+# =============================================================================
+
+class SupplyCache(ABC):
+    """Bounded key/value cache with O(1) get and put"""
+    
+    policy = 'base'
+    
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"Cache capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+    
+    @abstractmethod
+    def get(self, key: Any) -> Optional[Any]:
+        ...
+    
+    @abstractmethod
+    def put(self, key: Any, value: Any) -> None:
+        ...
+    
+    @abstractmethod
+    def discard(self, key: Any) -> bool:
+        """Remove key if present; True when an entry was dropped"""
+    
+    @abstractmethod
+    def items(self) -> List[Tuple[Any, Any]]:
+        """Snapshot of cached (key, value) pairs"""
+    
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+    
+    def stats(self) -> Dict[str, Any]:
+        """Eviction counters for diagnostics"""
+        return {
+            'policy': self.policy,
+            'capacity': self.capacity,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+class LRUCache(SupplyCache):
+    """Least-recently-used eviction"""
+    
+    policy = 'lru'
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._data = OrderedDict()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.capacity:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            self._data[key] = value
+    
+    def discard(self, key: Any) -> bool:
+        with self._lock:
+            return self._data.pop(key, None) is not None
+    
+    def items(self) -> List[Tuple[Any, Any]]:
+        with self._lock:
+            return list(self._data.items())
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+class LFUCache(SupplyCache):
+    """Least-frequently-used eviction (LRU among equal frequencies)"""
+    
+    policy = 'lfu'
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._data = {}  # key -> (value, frequency)
+        self._buckets = defaultdict(OrderedDict)  # frequency -> keys in LRU order
+        self._min_freq = 0
+    
+    def _touch(self, key: Any, freq: int) -> None:
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        self._buckets[freq + 1][key] = None
+    
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, freq = entry
+            self._touch(key, freq)
+            self._data[key] = (value, freq + 1)
+            return value
+    
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                freq = entry[1]
+                self._touch(key, freq)
+                self._data[key] = (value, freq + 1)
+                return
+            if len(self._data) >= self.capacity:
+                if self._min_freq not in self._buckets:
+                    # Discards can empty the minimum bucket
+                    self._min_freq = min(self._buckets)
+                bucket = self._buckets[self._min_freq]
+                victim, _ = bucket.popitem(last=False)
+                if not bucket:
+                    del self._buckets[self._min_freq]
+                del self._data[victim]
+                self.evictions += 1
+            self._data[key] = (value, 1)
+            self._buckets[1][key] = None
+            self._min_freq = 1
+    
+    def discard(self, key: Any) -> bool:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return False
+            bucket = self._buckets[entry[1]]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[entry[1]]
+            return True
+    
+    def items(self) -> List[Tuple[Any, Any]]:
+        with self._lock:
+            return [(key, entry[0]) for key, entry in self._data.items()]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._buckets.clear()
+            self._min_freq = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+class TTLCache(SupplyCache):
+    """Time-to-live expiry with oldest-first eviction when full"""
+    
+    policy = 'ttl'
+    
+    def __init__(self, capacity: int, ttl: float):
+        super().__init__(capacity)
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (value, expiry), in expiry order
+    
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                return None
+            return entry[0]
+    
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if key in self._data:
+                # Refreshed entries move to the back of the expiry order
+                del self._data[key]
+            else:
+                # Constant TTL keeps insertion order == expiry order
+                while self._data:
+                    oldest = next(iter(self._data.values()))
+                    if oldest[1] > now:
+                        break
+                    self._data.popitem(last=False)
+                    self.expirations += 1
+                if len(self._data) >= self.capacity:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+            self._data[key] = (value, now + self.ttl)
+    
+    def discard(self, key: Any) -> bool:
+        with self._lock:
+            return self._data.pop(key, None) is not None
+    
+    def items(self) -> List[Tuple[Any, Any]]:
+        with self._lock:
+            return [(key, entry[0]) for key, entry in self._data.items()]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+CACHE_POLICIES = {
+    'lru': LRUCache,
+    'lfu': LFUCache,
+    'ttl': TTLCache
+}
+
+def make_supply_cache(config: LFMConfig) -> SupplyCache:
+    """Build the tier-1 cache selected by config.tier1_cache_policy"""
+    policy = config.tier1_cache_policy.lower()
+    if policy not in CACHE_POLICIES:
+        raise ValueError(
+            f"Unknown cache policy '{config.tier1_cache_policy}'. "
+            f"Expected one of: {', '.join(CACHE_POLICIES)}"
+        )
+    if policy == 'ttl':
+        return TTLCache(config.tier1_cache_size, config.tier1_cache_ttl)
+    return CACHE_POLICIES[policy](config.tier1_cache_size)
+
+def _str_key(query: str) -> str:
+    """
+    Raw query string (its hash is cached on the object)
+    Not sys.intern: interned strings are immortal on Python 3.12, so
+    evicted long-tail queries would never be freed.
+    """
+    return query
+
+def _hash64_key(query: str) -> int:
+    """64-bit non-cryptographic hash (str hash is cached on the object)"""
+    return hash(query) & 0xFFFFFFFFFFFFFFFF
+
+def _blake2_key(query: str) -> bytes:
+    """128-bit BLAKE2b digest bytes"""
+    return hashlib.blake2b(query.encode(), digest_size=16).digest()
+
+CACHE_KEY_STRATEGIES = {
+    'str': _str_key,
+    'intern': _str_key,  # Former name of 'str', kept for existing configs
+    'hash64': _hash64_key,
+    'blake2': _blake2_key
+}
+
+# =============================================================================
+# PATTERN MATCHING - Compiled multi-keyword automaton
+# =============================================================================
+
+def popcount(mask: int) -> int:
+    """Number of set bits (int.bit_count needs Python 3.10)"""
+    return bin(mask).count('1')
+
+class DomainRegistry:
+    """
+    Append-only table of domain names and their bit positions
+    Classification results carry an int mask; names are decoded only at
+    the API boundary, with one cached tuple per distinct mask. The empty
+    mask decodes to the fallback ('general',).
+    """
+    
+    def __init__(self):
+        self._bits: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._decoded: Dict[int, Tuple[str, ...]] = {0: ('general',)}
+        self._lock = threading.Lock()  # Guards registration only
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._names)
+    
+    def bit(self, name: str) -> int:
+        """Bit for a domain, registering it on first use"""
+        bit = self._bits.get(name)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(name)
+                if bit is None:
+                    bit = 1 << len(self._names)
+                    self._names.append(sys.intern(name))
+                    self._bits[name] = bit
+        return bit
+    
+    def encode(self, names: Any) -> int:
+        mask = 0
+        for name in names:
+            mask |= self.bit(name)
+        return mask
+    
+    def decode(self, mask: int) -> Tuple[str, ...]:
+        names = self._decoded.get(mask)
+        if names is None:
+            names = tuple(name for i, name in enumerate(self._names) if mask >> i & 1)
+            names = self._decoded.setdefault(mask, names)
+        return names
+    
+    def mask_array(self, masks: Any) -> np.ndarray:
+        """Masks as uint64 while every bit fits, else as Python ints"""
+        return np.array(list(masks), dtype=np.uint64 if len(self._names) <= 64 else object)
+    
+    def histogram(self, masks: Any) -> Dict[str, int]:
+        """Per-domain counts over a batch of masks, 'general' for empty ones"""
+        masks = masks if isinstance(masks, np.ndarray) else self.mask_array(masks)
+        counts = {'general': int(np.count_nonzero(masks == 0))}
+        for i, name in enumerate(self._names):
+            bit = np.uint64(1 << i) if masks.dtype == np.uint64 else 1 << i
+            hits = int(np.count_nonzero(masks & bit))
+            if hits:
+                counts[name] = counts.get(name, 0) + hits
+        return counts
+
+DOMAIN_REGISTRY = DomainRegistry()
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over the domain pattern library
+    Reports every domain with a keyword occurring in the text in one pass
+    """
+    
+    def __init__(self, registry: Optional[DomainRegistry] = None):
+        self.registry = registry if registry is not None else DOMAIN_REGISTRY
+        self._goto: List[Dict[str, int]] = [{}]  # Trie transitions per node
+        self._own: List[int] = [0]  # Mask of domains ending at node
+        self._fail: List[int] = [0]
+        self._out: List[int] = [0]  # Own + failure-chain domain mask
+        self._domain_bits: Dict[str, int] = {}
+        self._dirty = False
+        self.keyword_count = 0
+    
+    def copy(self) -> 'KeywordAutomaton':
+        """Independent copy that can be extended while this one serves matches"""
+        clone = KeywordAutomaton.__new__(KeywordAutomaton)
+        clone.registry = self.registry
+        clone._goto = [dict(edges) for edges in self._goto]
+        clone._own = list(self._own)
+        clone._fail = list(self._fail)
+        clone._out = list(self._out)
+        clone._domain_bits = dict(self._domain_bits)
+        clone._dirty = self._dirty
+        clone.keyword_count = self.keyword_count
+        return clone
+    
+    @property
+    def domains(self) -> List[str]:
+        return list(self._domain_bits)
+    
+    def add_domain(self, domain: str, keywords: List[str]) -> None:
+        """Insert keywords into the trie; failure links refresh on next build"""
+        bit = self._domain_bits.get(domain)
+        if bit is None:
+            bit = self._domain_bits[domain] = self.registry.bit(domain)
+        
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if not keyword:
+                continue
+            node = 0
+            for ch in keyword:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._own.append(0)
+                    self._fail.append(0)
+                    self._out.append(0)
+                    self._goto[node][ch] = nxt
+                node = nxt
+            if not self._own[node] & bit:
+                self._own[node] |= bit
+                self.keyword_count += 1
+        
+        self._dirty = True
+    
+    def build(self) -> 'KeywordAutomaton':
+        """Compute failure links and output masks breadth-first"""
+        goto, own = self._goto, self._own
+        fail = [0] * len(goto)
+        out = list(own)
+        
+        frontier = deque(goto[0].values())
+        while frontier:
+            node = frontier.popleft()
+            for ch, child in goto[node].items():
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(ch, 0)
+                fail[child] = target if target != child else 0
+                out[child] |= out[fail[child]]
+                frontier.append(child)
+        
+        self._fail = fail
+        self._out = out
+        self._dirty = False
+        return self
+    
+    def match_mask(self, text: str) -> int:
+        """Registry mask of all domains with a keyword in text"""
+        if self._dirty:
+            self.build()
+        goto, fail, out = self._goto, self._fail, self._out
+        
+        node = 0
+        found = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            found |= out[node]
+        return found
+    
+    def match(self, text: str) -> List[str]:
+        """All domains with a keyword in text, in registry order"""
+        mask = self.match_mask(text)
+        return list(self.registry.decode(mask)) if mask else []
+
+DEFAULT_PATTERNS = {
+    'physics': ['momentum', 'energy', 'conservation', 'field', 'particle'],
+    'legal': ['contract', 'law', 'precedent', 'liability', 'rights'],
+    'economic': ['market', 'optimization', 'supply', 'demand', 'equilibrium'],
+    'biological': ['cell', 'protein', 'dna', 'evolution', 'metabolism'],
+    'cognitive': ['reasoning', 'learning', 'memory', 'attention', 'perception']
+}
+
+class KeywordPrefilter:
+    """
+    Cheap necessary condition for any keyword match
+    Keeps a short prefix (anchor) of every keyword. Matching is by
+    substring, so text containing a keyword contains its anchor and a
+    rejection is never wrong. Small anchor sets are tested with str
+    containment (a C scan per anchor); larger ones by probing every
+    anchor-length window of the text once against a set, so the cost
+    stays O(len(text)) whatever the library size.
+    """
+    
+    SCAN_LIMIT = 32  # Anchors above which per-anchor scans stop paying off
+    
+    def __init__(self, keywords: Any, anchor: int = 4):
+        self.anchor = anchor
+        candidates = sorted({kw[:anchor] for kw in keywords if kw}, key=len)
+        
+        # An anchor containing a shorter one adds nothing
+        short: List[str] = []
+        anchors = []
+        for candidate in candidates:
+            if short and any(s in candidate for s in short):
+                continue
+            if len(candidate) < anchor:
+                short.append(candidate)
+            anchors.append(candidate)
+        self._short = tuple(short)
+        self._full = frozenset(anchors[len(short):])
+        self._scan = tuple(anchors) if len(anchors) <= self.SCAN_LIMIT else None
+    
+    def __len__(self) -> int:
+        return len(self._short) + len(self._full)
+    
+    def with_keywords(self, keywords: Any) -> 'KeywordPrefilter':
+        """Extended copy; costs O(new keywords) plus one set union"""
+        added = KeywordPrefilter((kw.lower() for kw in keywords), self.anchor)
+        clone = KeywordPrefilter.__new__(KeywordPrefilter)
+        clone.anchor = self.anchor
+        clone._short = self._short + tuple(a for a in added._short if a not in self._short)
+        clone._full = self._full | added._full
+        anchors = clone._short + tuple(clone._full)
+        clone._scan = anchors if len(anchors) <= self.SCAN_LIMIT else None
+        return clone
+    
+    def may_match(self, text: str) -> bool:
+        if self._scan is not None:
+            return any(a in text for a in self._scan)
+        if self._short and any(a in text for a in self._short):
+            return True
+        windows = zip(*(text[i:] for i in range(self.anchor)))
+        return not self._full.isdisjoint(map(''.join, windows))
+
+@dataclass(frozen=True)
+class PatternLibrary:
+    """
+    Immutable, versioned snapshot of domain keywords and their matcher
+    Keywords added with with_domain go into a small delta automaton whose
+    matches are OR-ed with the main one; the delta is folded into a fresh
+    main automaton once it outgrows DELTA_FRACTION of it.
+    """
+    version: str
+    patterns: Dict[str, Tuple[str, ...]]
+    matcher: KeywordAutomaton
+    prefilter: KeywordPrefilter
+    delta: Optional[KeywordAutomaton] = None
+    
+    DELTA_MIN = 64  # Keywords the delta may always hold
+    DELTA_FRACTION = 8  # ... or 1/8 of the main automaton, if larger
+    
+    @staticmethod
+    def _compile(patterns: Dict[str, Tuple[str, ...]]) -> KeywordAutomaton:
+        matcher = KeywordAutomaton()
+        for domain, keywords in patterns.items():
+            matcher.add_domain(domain, keywords)
+        return matcher.build()
+    
+    @classmethod
+    def from_patterns(cls, patterns: Dict[str, List[str]], version: str = 'builtin') -> 'PatternLibrary':
+        """Compile a {domain: keywords} mapping"""
+        normalized = {
+            domain: tuple(dict.fromkeys(kw.lower() for kw in keywords if kw))
+            for domain, keywords in patterns.items()
+        }
+        prefilter = KeywordPrefilter(kw for keywords in normalized.values() for kw in keywords)
+        return cls(version=version, patterns=normalized, matcher=cls._compile(normalized), prefilter=prefilter)
+    
+    @property
+    def keyword_count(self) -> int:
+        return self.matcher.keyword_count + (self.delta.keyword_count if self.delta else 0)
+    
+    def match_mask(self, text: str) -> int:
+        """Registry mask of all domains with a keyword in text"""
+        if self.delta is None:
+            return self.matcher.match_mask(text)
+        return self.matcher.match_mask(text) | self.delta.match_mask(text)
+    
+    @classmethod
+    def load(cls, filepath: str, version: Optional[str] = None) -> 'PatternLibrary':
+        """
+        Load a library from JSON or TSV
+        JSON: {"version": ..., "domains": {domain: [keywords]}} or a bare mapping
+        TSV: one "domain<TAB>keyword" pair per line, '#' starts a comment
+        """
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        
+        if filepath.lower().endswith('.json'):
+            data = json.loads(raw.decode('utf-8'))
+            patterns = data.get('domains', data) if isinstance(data, dict) else None
+            if not isinstance(patterns, dict):
+                raise ValueError(f"{filepath}: expected a mapping of domain -> keywords")
+            version = version or data.get('version')
+        else:
+            patterns = defaultdict(list)
+            for lineno, line in enumerate(raw.decode('utf-8').splitlines(), 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                parts = line.split('\t')
+                if len(parts) != 2:
+                    raise ValueError(f"{filepath}:{lineno}: expected 'domain<TAB>keyword'")
+                patterns[parts[0].strip()].append(parts[1].strip())
+        
+        # Content hash keeps versions stable across reloads of the same file
+        version = str(version or hashlib.blake2b(raw, digest_size=6).hexdigest())
+        return cls.from_patterns(patterns, version=version)
+    
+    def with_domain(self, domain: str, keywords: List[str]) -> 'PatternLibrary':
+        """New library with keywords added; the main trie is shared, not copied"""
+        keywords = [kw.lower() for kw in keywords if kw]
+        patterns = dict(self.patterns)
+        patterns[domain] = tuple(dict.fromkeys(patterns.get(domain, ()) + tuple(keywords)))
+        
+        delta = self.delta.copy() if self.delta is not None else KeywordAutomaton()
+        delta.add_domain(domain, keywords)
+        matcher = self.matcher
+        if delta.keyword_count > max(self.DELTA_MIN, matcher.keyword_count // self.DELTA_FRACTION):
+            matcher, delta = self._compile(patterns), None
+        else:
+            delta.build()
+        
+        return PatternLibrary(
+            version=f"{self.version}+{domain}",
+            patterns=patterns,
+            matcher=matcher,
+            prefilter=self.prefilter.with_keywords(keywords),
+            delta=delta
+        )
+    
+    def changed_keywords(self, other: 'PatternLibrary') -> set:
+        """Keywords whose domain membership differs between two libraries"""
+        changed = set()
+        for domain in self.patterns.keys() | other.patterns.keys():
+            mine, theirs = self.patterns.get(domain, ()), other.patterns.get(domain, ())
+            if mine is not theirs and mine != theirs:
+                changed |= set(mine) ^ set(theirs)
+        return changed
+
 # =============================================================================
 # TWO-TIER NEURAL ARCHITECTURE
 # =============================================================================
@@ -356,83 +1734,463 @@ class NeuralDataSupply:
     
     def __init__(self, config: LFMConfig):
         self.config = config
-        self.cache = weakref.WeakValueDictionary()
-        self.supply_queue = deque(maxlen=config.tier1_cache_size)
-        self.hits = 0
-        self.misses = 0
-        
-        # Pattern library for fast matching
-        self.patterns = {
-            'physics': ['momentum', 'energy', 'conservation', 'field', 'particle'],
-            'legal': ['contract', 'law', 'precedent', 'liability', 'rights'],
-            'economic': ['market', 'optimization', 'supply', 'demand', 'equilibrium'],
-            'biological': ['cell', 'protein', 'dna', 'evolution', 'metabolism'],
-            'cognitive': ['reasoning', 'learning', 'memory', 'attention', 'perception']
+        self.cache = make_supply_cache(config)
+        self.counters = StripedCounters([
+            'hits', 'misses', 'collisions', 'invalidations', 'library_swaps',
+            'prefilter_rejections', 'prefilter_passes', 'prefilter_false_positives'
+        ])
+        self.use_prefilter = config.tier1_prefilter
+        self._swap_lock = threading.Lock()  # Orders library swaps against cache fills
+        
+        strategy = config.tier1_key_strategy.lower()
+        if strategy not in CACHE_KEY_STRATEGIES:
+            raise ValueError(
+                f"Unknown key strategy '{config.tier1_key_strategy}'. "
+                f"Expected one of: {', '.join(CACHE_KEY_STRATEGIES)}"
+            )
+        self.key_strategy = strategy
+        self._make_key = CACHE_KEY_STRATEGIES[strategy]
+        
+        # Versioned pattern library, replaced atomically on reload
+        self.library = PatternLibrary.from_patterns(DEFAULT_PATTERNS)
+        if config.pattern_library_path:
+            self.library = PatternLibrary.load(config.pattern_library_path)
+    
+    @property
+    def hits(self) -> int:
+        return self.counters.value('hits')
+    
+    @property
+    def misses(self) -> int:
+        return self.counters.value('misses')
+    
+    @property
+    def collisions(self) -> int:
+        return self.counters.value('collisions')
+    
+    @property
+    def invalidations(self) -> int:
+        return self.counters.value('invalidations')
+    
+    def prefilter_stats(self) -> Dict[str, Any]:
+        passes = self.counters.value('prefilter_passes')
+        rejections = self.counters.value('prefilter_rejections')
+        false_positives = self.counters.value('prefilter_false_positives')
+        return {
+            'enabled': self.use_prefilter,
+            'anchors': len(self.library.prefilter),
+            'rejections': rejections,
+            'passes': passes,
+            'false_positives': false_positives,
+            'false_positive_rate': false_positives / passes if passes else 0.0,
+            'rejection_rate': rejections / (passes + rejections) if (passes + rejections) else 0.0
         }
     
-    def fast_supply(self, query: str) -> Dict[str, Any]:
+    @property
+    def patterns(self) -> Dict[str, Tuple[str, ...]]:
+        return self.library.patterns
+    
+    @property
+    def matcher(self) -> KeywordAutomaton:
+        return self.library.matcher
+    
+    def add_domain(self, domain: str, keywords: List[str]) -> int:
+        """Register new domain keywords without recompiling the library"""
+        return self.swap_library(self.library.with_domain(domain, keywords))
+    
+    def load_patterns(self, filepath: str) -> int:
+        """Hot-reload the pattern library from a JSON/TSV file"""
+        return self.swap_library(PatternLibrary.load(filepath))
+    
+    def swap_library(self, library: PatternLibrary) -> int:
+        """
+        Atomically install a new library and drop only the cache entries
+        whose classification could change. Returns the number invalidated.
+        """
+        with self._swap_lock:
+            changed = self.library.changed_keywords(library)
+            self.library = library
+            self.counters.incr('library_swaps')
+            
+            if not changed:
+                return 0
+            
+            # Any cached query containing a changed keyword may reclassify
+            detector = KeywordAutomaton(DomainRegistry())
+            detector.add_domain('changed', changed)
+            detector.build()
+            
+            invalidated = 0
+            for key, supply_data in self.cache.items():
+                if detector.match(supply_data.query.lower()):
+                    invalidated += self.cache.discard(key)
+        
+        self.counters.incr('invalidations', invalidated)
+        return invalidated
+    
+    def fast_supply(self, query: str) -> 'SupplyData':
         """Ultra-fast data supply through pattern matching"""
-        # Hash for cache lookup
-        query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
+        # Key for cache lookup
+        key = self._make_key(query)
         
-        # Check cache
-        if query_hash in self.cache:
-            self.hits += 1
-            return self.cache[query_hash]
+        # Check cache, verifying the full query so key collisions never
+        # return another query's data
+        cached = self.cache.get(key)
+        if cached is not None:
+            if cached.query == query:
+                self.counters.incr('hits')
+                return cached
+            self.counters.incr('collisions')
         
-        self.misses += 1
+        self.counters.incr('misses')
         
         # Fast pattern matching
-        query_lower = query.lower()
-        matched_domains = []
+        library = self.library
+        supply_data = self._classify(query, library, time.time())
         
-        for domain, keywords in self.patterns.items():
-            if any(kw in query_lower for kw in keywords):
-                matched_domains.append(domain)
+        # Cache result unless the library was swapped mid-classification;
+        # the lock keeps a swap's invalidation scan from running in between
+        with self._swap_lock:
+            if self.library is library:
+                self.cache.put(key, supply_data)
         
-        # Create supply data
-        supply_data = SupplyData(
-            query=query,
-            domains=matched_domains if matched_domains else ['general'],
-            confidence=0.8 if matched_domains else 0.5,
-            timestamp=time.time()
-        )
+        return supply_data
+    
+    def fast_supply_batch(self, queries: List[str]) -> Dict[str, Any]:
+        """
+        Columnar supply for a batch: one cache probe pass, then each
+        distinct missed query is classified once
+        """
+        n = len(queries)
+        records = [None] * n
+        hit = np.ones(n, dtype=bool)
+        pending = {}  # missed query -> (key, positions)
         
-        # Cache result
-        self.cache[query_hash] = supply_data
-        self.supply_queue.append(supply_data)
+        make_key, cache_get = self._make_key, self.cache.get
+        collisions = 0
+        for i, query in enumerate(queries):
+            key = make_key(query)
+            cached = cache_get(key)
+            if cached is not None and cached.query == query:
+                records[i] = cached
+                continue
+            if query in pending:
+                pending[query][1].append(i)
+                continue
+            if cached is not None:
+                collisions += 1
+            pending[query] = (key, [i])
+            hit[i] = False
+        
+        # Bulk classification of the misses
+        library = self.library
+        now = time.time()
+        fills = []
+        for query, (key, positions) in pending.items():
+            supply_data = self._classify(query, library, now)
+            for i in positions:
+                records[i] = supply_data
+            fills.append((key, supply_data))
+        
+        with self._swap_lock:
+            if self.library is library:
+                for key, supply_data in fills:
+                    self.cache.put(key, supply_data)
+        
+        self.counters.incr('hits', n - len(pending))
+        self.counters.incr('misses', len(pending))
+        if collisions:
+            self.counters.incr('collisions', collisions)
         
-        return supply_data.__dict__
+        return {
+            'query': list(queries),
+            'domains': [r.domains for r in records],
+            'domain_mask': DOMAIN_REGISTRY.mask_array(r.domain_mask for r in records),
+            'confidence': np.fromiter((r.confidence for r in records), dtype=np.float64, count=n),
+            'cache_hit': hit
+        }
+    
+    def _classify(self, query: str, library: 'PatternLibrary', timestamp: float) -> 'SupplyData':
+        """Build supply data for a cache miss"""
+        text = query.lower()
+        if not self.use_prefilter:
+            mask = library.match_mask(text)
+        elif library.prefilter.may_match(text):
+            mask = library.match_mask(text)
+            self.counters.incr('prefilter_passes')
+            if not mask:
+                self.counters.incr('prefilter_false_positives')
+        else:
+            mask = 0
+            self.counters.incr('prefilter_rejections')
+        return SupplyData(
+            query=query,
+            domain_mask=mask,
+            confidence=0.8 if mask else 0.5,
+            timestamp=timestamp
+        )
 
-@dataclass
+@dataclass(frozen=True)
 class SupplyData:
-    """Data structure for neural supply"""
+    """
+    Immutable, slotted tier-1 supply record; reads like a dict
+    Domains are held as a DOMAIN_REGISTRY mask and decoded on access.
+    """
+    __slots__ = ('query', 'domain_mask', 'confidence', 'timestamp')
     query: str
-    domains: List[str]
+    domain_mask: int
     confidence: float
     timestamp: float
+    
+    KEYS = ('query', 'domains', 'confidence', 'timestamp')
+    
+    @classmethod
+    def from_domains(cls, query: str, domains: Any, confidence: float, timestamp: float) -> 'SupplyData':
+        return cls(query, DOMAIN_REGISTRY.encode(domains), confidence, timestamp)
+    
+    @property
+    def domains(self) -> Tuple[str, ...]:
+        return DOMAIN_REGISTRY.decode(self.domain_mask)
+    
+    @property
+    def domain_count(self) -> int:
+        return popcount(self.domain_mask) or 1  # 'general'
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self.KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.KEYS
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.KEYS else default
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self.KEYS
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.KEYS}
+    
+    def __reduce__(self):
+        # Frozen slots cannot be restored through setattr, and bit positions
+        # are per process, so pickles carry domain names
+        names = self.domains if self.domain_mask else ()
+        return (SupplyData.from_domains, (self.query, names, self.confidence, self.timestamp))
+
+class RollingStats:
+    """
+    Running mean and variance of the last `window` values
+    Welford updates with removal over a ring buffer make push O(1); the
+    moments are recomputed exactly once per turn of the ring so rounding
+    drift cannot build up over long runs.
+    """
+    
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError(f"Window must be positive, got {window}")
+        self.window = window
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._ring = np.zeros(window, dtype=np.float64)
+        self._next = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def variance(self) -> float:
+        """Population variance, as np.var"""
+        return max(self._m2 / self.count, 0.0) if self.count else 0.0
+    
+    def push(self, x: float) -> None:
+        x = float(x)
+        with self._lock:
+            if self.count == self.window:
+                old = self._ring[self._next].item()
+                if self.count == 1:
+                    self.count, self.mean, self._m2 = 0, 0.0, 0.0
+                else:
+                    mean = (self.count * self.mean - old) / (self.count - 1)
+                    self._m2 -= (old - self.mean) * (old - mean)
+                    self.mean = mean
+                    self.count -= 1
+            
+            self.count += 1
+            delta = x - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (x - self.mean)
+            
+            self._ring[self._next] = x
+            self._next = (self._next + 1) % self.window
+            if self._next == 0:
+                self.mean = float(self._ring.mean())
+                self._m2 = float(np.sum((self._ring - self.mean) ** 2))
+    
+    def extend(self, values: Any) -> None:
+        for x in values:
+            self.push(x)
+    
+    def values(self) -> np.ndarray:
+        """Window contents, oldest first"""
+        with self._lock:
+            if self.count < self.window:
+                return self._ring[:self.count].copy()
+            return np.concatenate([self._ring[self._next:], self._ring[:self._next]])
+
+class DecisionHistory:
+    """
+    Fixed-width ring buffer of executive decisions
+    Stores the numeric fields of each result plus a stable 64-bit context
+    ID in one preallocated structured array. With spill_path set, each full
+    turn of the ring is appended to that file before being overwritten.
+    """
+    
+    DTYPE = np.dtype([
+        ('confidence', '<f8'),
+        ('psi', '<f8'),
+        ('tau', '<f8'),
+        ('reasoning_time', '<f8'),
+        ('axioms_applied', '<i4'),
+        ('context_id', '<u8')
+    ])
+    
+    def __init__(self, maxlen: int, spill_path: Optional[str] = None):
+        if maxlen < 1:
+            raise ValueError(f"History size must be positive, got {maxlen}")
+        self.maxlen = maxlen
+        self.spill_path = spill_path
+        self.total = 0  # Decisions ever recorded
+        self.spilled = 0  # Decisions written to spill_path
+        self._ring = np.zeros(maxlen, dtype=self.DTYPE)
+        self._next = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def context_id(context: str) -> int:
+        """Stable 64-bit ID of a context string (same across processes)"""
+        return int.from_bytes(hashlib.blake2b(context.encode('utf-8', 'surrogatepass'), digest_size=8).digest(), 'little')
+    
+    def __len__(self) -> int:
+        return min(self.total, self.maxlen)
+    
+    @classmethod
+    def _row(cls, result: Dict[str, Any]) -> Tuple:
+        state = result['physics_state']
+        return (result['confidence'], state['psi'], state['tau'], result['reasoning_time'],
+                result['axioms_applied'], cls.context_id(result['context']))
+    
+    def append(self, result: Dict[str, Any]) -> None:
+        """Write one decision straight into the ring"""
+        row = self._row(result)
+        with self._lock:
+            self._ring[self._next] = row
+            self.total += 1
+            self._next += 1
+            if self._next == self.maxlen:
+                self._wrap()
+    
+    def extend(self, results: List[Dict[str, Any]]) -> None:
+        records = np.empty(len(results), dtype=self.DTYPE)
+        for i, r in enumerate(results):
+            records[i] = self._row(r)
+        self.extend_records(records)
+    
+    def extend_records(self, records: np.ndarray) -> None:
+        """Append a structured array of DTYPE rows"""
+        with self._lock:
+            self.total += len(records)
+            if len(records) > self.maxlen and self.spill_path is None:
+                # Older rows would be overwritten anyway; keep the ring
+                # position as if they had been written
+                skipped = len(records) - self.maxlen
+                self._next = (self._next + skipped) % self.maxlen
+                records = records[-self.maxlen:]
+            start = 0
+            while start < len(records):
+                take = min(len(records) - start, self.maxlen - self._next)
+                self._ring[self._next:self._next + take] = records[start:start + take]
+                self._next += take
+                start += take
+                if self._next == self.maxlen:
+                    self._wrap()
+    
+    def _wrap(self) -> None:
+        """Restart the ring after a full turn, spilling it first if configured (lock held)"""
+        self._next = 0
+        if self.spill_path is not None:
+            with open(self.spill_path, 'ab') as f:
+                self._ring.tofile(f)
+            self.spilled += self.maxlen
+    
+    def window(self, n: Optional[int] = None) -> np.ndarray:
+        """Copy of the last n decisions (default all held), oldest first"""
+        with self._lock:
+            held = len(self)
+            n = held if n is None else min(n, held)
+            if held < self.maxlen:
+                return self._ring[held - n:held].copy()
+            ordered = np.concatenate([self._ring[self._next:], self._ring[:self._next]])
+            return ordered[self.maxlen - n:]
+    
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        return self.window(n)[name]
+    
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        held = len(self)
+        if not -held <= i < held:
+            raise IndexError('decision history index out of range')
+        i = i % held
+        row = self._ring[(self._next - held + i) % self.maxlen]
+        return {name: row[name].item() for name in self.DTYPE.names}
+    
+    @classmethod
+    def load_spill(cls, filepath: str, mmap: bool = True) -> np.ndarray:
+        """Spilled decisions in recording order"""
+        if mmap:
+            return np.memmap(filepath, dtype=cls.DTYPE, mode='r')
+        return np.fromfile(filepath, dtype=cls.DTYPE)
 
 class LFMExecutiveReasoning:
     """TIER 2: LFM frontal lobe for executive reasoning"""
     
-    def __init__(self, physics: PhysicsAxioms, ai: AIStabilityAxioms, math: RelationalMathematics):
+    def __init__(self, physics: PhysicsAxioms, ai: AIStabilityAxioms, math: RelationalMathematics,
+                 seed: Optional[np.random.SeedSequence] = None, history_size: int = 100,
+                 history_spill_path: Optional[str] = None):
         self.physics = physics
         self.ai = ai
         self.math = math
-        self.reasoning_count = 0
-        self.decision_history = deque(maxlen=100)
+        self._counters = StripedCounters(['reasoning'])
+        self.decision_history = DecisionHistory(history_size, spill_path=history_spill_path)
+        self.confidence_stats = RollingStats(history_size)  # Stability window
+        self.ai_pipeline = ai.compile_pipeline('executive', [
+            ('patterns', 'pattern_recognition', lambda context, domains: (np.array([ord(c) for c in context[:100]]),)),
+            ('network_strength', 'network_effects', lambda context, domains: (len(domains),)),
+            ('complexity', 'complexity', lambda context, domains: (len(context.split()),)),
+        ])
+        
+        # Reasoning streams are keyed by query, not by thread or call order
+        self._seed = seed if seed is not None else np.random.SeedSequence()
+    
+    def _stream(self, context: str) -> np.random.Generator:
+        """Generator for one query: a pure function of the seed and the context"""
+        key = self._seed.spawn_key + (DecisionHistory.context_id(context),)
+        return np.random.default_rng(np.random.SeedSequence(self._seed.entropy, spawn_key=key))
+    
+    @property
+    def reasoning_count(self) -> int:
+        return self._counters.value('reasoning')
     
     def executive_analysis(self, context: str, supply_data: Dict) -> Dict[str, Any]:
         """High-quality reasoning using all 24 axioms"""
-        self.reasoning_count += 1
+        self._counters.incr('reasoning')
         start_time = time.time()
         
         # Extract domains from supply data
         domains = supply_data.get('domains', ['general'])
         
-        # Initialize reasoning state
-        psi = np.random.randn()  # ψ-field state
-        tau = np.random.randn()  # τ-field state
+        # Initialize reasoning state: ψ-field and τ-field in one draw
+        psi, tau = self._stream(context).standard_normal(2).tolist()
         
         # Apply physics axioms
         physics_analysis = self._apply_physics_reasoning(psi, tau, context)
@@ -462,8 +2220,176 @@ class LFMExecutiveReasoning:
         }
         
         self.decision_history.append(result)
+        self.confidence_stats.push(result['confidence'])
         return result
     
+    def executive_analysis_batch(self, contexts: List[str], supply_batch: Any) -> List[Dict[str, Any]]:
+        """
+        Vectorized executive_analysis over a batch of queries
+        supply_batch is a list of supply dicts or the columnar output of
+        fast_supply_batch. Per-query results match the scalar path for
+        the same seed.
+        """
+        n = len(contexts)
+        if n == 0:
+            return []
+        self._counters.incr('reasoning', n)
+        start_time = time.time()
+        
+        if isinstance(supply_batch, dict):
+            domains = supply_batch['domains']
+            confidence = np.asarray(supply_batch['confidence'], dtype=np.float64)
+        else:
+            domains = [s.get('domains', ['general']) for s in supply_batch]
+            confidence = np.array([s.get('confidence', 0.5) for s in supply_batch], dtype=np.float64)
+        
+        # Initialize reasoning state - same per-query streams as the scalar path
+        states = np.array([self._stream(c).standard_normal(2) for c in contexts])
+        psi, tau = states[:, 0], states[:, 1]
+        
+        # Axioms seen so far, as the scalar path would report after each query
+        physics_seen = len(set(self.physics.axiom_calls) | {'conservation', 'entropy', 'uncertainty'})
+        ai_seen = set(self.ai.axiom_applications) | {'pattern_recognition', 'network_effects', 'complexity'}
+        ai_without_stability = len(ai_seen - {'stability'})
+        had_history = len(self.decision_history) > 0
+        
+        confidence = confidence * 1.2  # Boost from reasoning
+        physics = self._apply_physics_reasoning_batch(states)
+        ai = self._apply_ai_reasoning_batch(contexts, domains, confidence)
+        
+        # Relational mathematics integration
+        psi_evolved, tau_evolved = self.math.relational_product_array(psi, tau)
+        
+        pressure = self.math.pressure_scale(66)
+        reasoning_time = (time.time() - start_time) / n
+        
+        results = []
+        for i in range(n):
+            stability_seen = 'stability' in ai_seen or had_history or i > 0
+            results.append({
+                'context': contexts[i],
+                'domains': domains[i],
+                'physics_state': {
+                    'psi': float(psi_evolved[i]),
+                    'tau': float(tau_evolved[i]),
+                    'pressure_scale': pressure
+                },
+                'ai_insights': ai[i],
+                'physics_insights': physics[i],
+                'confidence': float(confidence[i]),
+                'reasoning_time': reasoning_time,
+                'axioms_applied': physics_seen + ai_without_stability + stability_seen
+            })
+        
+        records = np.empty(n, dtype=DecisionHistory.DTYPE)
+        records['confidence'] = confidence
+        records['psi'] = psi_evolved
+        records['tau'] = tau_evolved
+        records['reasoning_time'] = reasoning_time
+        records['axioms_applied'] = [r['axioms_applied'] for r in results]
+        records['context_id'] = [DecisionHistory.context_id(c) for c in contexts]
+        self.decision_history.extend_records(records)
+        self.confidence_stats.extend(confidence)
+        return results
+    
+    def _apply_physics_reasoning_batch(self, states: np.ndarray) -> List[Dict]:
+        """Vectorized _apply_physics_reasoning over (n, 2) psi/tau states"""
+        n = len(states)
+        final_states = states * 1.1  # Evolution
+        
+        conservation = self.physics.conservation_batch(states, final_states)
+        entropy = self.physics.entropy_batch(np.abs(states))
+        uncertainty = self.physics.uncertainty_batch(np.abs(states[:, 0]), np.abs(states[:, 1]))
+        
+        # Matter formation check
+        k = 66  # Nuclear scale
+        matter_possible = k >= 66 and self.math.pressure_scale(k) >= 1e32
+        
+        return [
+            {
+                'conservation': conservation[i],
+                'entropy': entropy[i],
+                'uncertainty': float(uncertainty[i]),
+                'matter_formation_possible': matter_possible
+            }
+            for i in range(n)
+        ]
+    
+    def _apply_ai_reasoning_batch(self, contexts: List[str], domains: List[List[str]],
+                                  confidence: np.ndarray) -> List[Dict]:
+        """Vectorized _apply_ai_reasoning with one FFT per context length"""
+        n = len(contexts)
+        patterns: List[Optional[Dict]] = [None] * n
+        
+        # Group contexts by (truncated) length and FFT each group as a matrix
+        by_length = defaultdict(list)
+        for i, context in enumerate(contexts):
+            by_length[min(len(context), 100)].append(i)
+        
+        batched = 0
+        for length, rows in by_length.items():
+            if length < 2:
+                # Degenerate spectra keep the scalar axiom's behaviour
+                for i in rows:
+                    patterns[i] = self.ai.pattern_recognition(
+                        np.array([ord(c) for c in contexts[i][:100]])
+                    )
+                continue
+            codes = np.frombuffer(
+                ''.join(contexts[i][:100] for i in rows).encode('utf-32-le'), dtype=np.uint32
+            ).astype(np.int64).reshape(len(rows), length)
+            spectrum = np.fft.fft(codes, axis=1)
+            dominant = np.argmax(np.abs(spectrum[:, :length // 2]), axis=1)
+            strength = np.abs(spectrum[np.arange(len(rows)), dominant])
+            for j, i in enumerate(rows):
+                patterns[i] = {'dominant_frequency': dominant[j], 'strength': strength[j]}
+            batched += len(rows)
+        
+        # Network effects and complexity
+        nodes = np.array([len(d) for d in domains], dtype=np.float64)
+        network = nodes * (nodes - 1) / 2  # Metcalfe's law
+        words = np.array([len(c.split()) for c in contexts], dtype=np.float64)
+        complexity = words * np.log(words + 1)
+        
+        # Stability over the confidence window each query would have seen
+        history = self.confidence_stats.values()
+        stable = self._rolling_stability(history, confidence, self.confidence_stats.window)
+        
+        if batched:
+            self.ai.axiom_applications.incr('pattern_recognition', batched)
+        self.ai.axiom_applications.incr('network_effects', n)
+        self.ai.axiom_applications.incr('complexity', n)
+        stability_checks = n if len(history) else n - 1
+        if stability_checks:
+            self.ai.axiom_applications.incr('stability', stability_checks)
+        
+        return [
+            {
+                'patterns': patterns[i],
+                'network_strength': float(network[i]),
+                'complexity': complexity[i],
+                'stable': stable[i]
+            }
+            for i in range(n)
+        ]
+    
+    @staticmethod
+    def _rolling_stability(history: np.ndarray, confidence: np.ndarray, window: int) -> List[Any]:
+        """Variance check on the trailing window before each new confidence"""
+        values = np.concatenate([history, confidence[:-1]])
+        s1 = np.concatenate([[0.0], np.cumsum(values)])
+        s2 = np.concatenate([[0.0], np.cumsum(values * values)])
+        
+        end = np.arange(len(history), len(history) + len(confidence))
+        start = np.maximum(end - window, 0)
+        count = np.maximum(end - start, 1)
+        mean = (s1[end] - s1[start]) / count
+        variance = (s2[end] - s2[start]) / count - mean * mean
+        stable = variance < 1.0
+        
+        # A single point (or none) is trivially stable, as in the scalar axiom
+        return [bool(stable[i]) if c > 1 else True for i, c in enumerate(end - start)]
+    
     def _apply_physics_reasoning(self, psi: float, tau: float, context: str) -> Dict:
         """Apply physics axioms to reasoning"""
         results = {}
@@ -486,22 +2412,13 @@ class LFMExecutiveReasoning:
     
     def _apply_ai_reasoning(self, context: str, domains: List[str]) -> Dict:
         """Apply AI stability axioms"""
-        results = {}
-        
-        # Pattern recognition on context
-        context_vector = np.array([ord(c) for c in context[:100]])
-        results['patterns'] = self.ai.pattern_recognition(context_vector)
-        
-        # Network effects based on domains
-        results['network_strength'] = self.ai.network_effects(len(domains))
-        
-        # Complexity measure
-        results['complexity'] = self.ai.complexity_emergence(len(context.split()))
+        # Patterns on context, network effects of domains, complexity measure
+        results = self.ai_pipeline(context, domains)
         
-        # Stability check
-        if self.decision_history:
-            trajectory = np.array([d['confidence'] for d in self.decision_history])
-            results['stable'] = self.ai.stability(trajectory)
+        # Stability check on the running confidence moments
+        stats = self.confidence_stats
+        if stats.count:
+            results['stable'] = self.ai.stability_moments(stats.count, stats.variance)
         else:
             results['stable'] = True
         
@@ -514,8 +2431,9 @@ class LFMExecutiveReasoning:
 class EpistemicHumility:
     """Core principle: Always remain humble and keep improving"""
     
-    def __init__(self, config: LFMConfig):
+    def __init__(self, config: LFMConfig, rng: Optional[np.random.Generator] = None):
         self.config = config
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.uncertainty_acknowledgments = 0
         self.improvement_suggestions = []
         self.learning_events = []
@@ -563,12 +2481,127 @@ class EpistemicHumility:
             "Seek external validation for all claims",
             "Never believe you've 'arrived' - keep growing"
         ]
-        return np.random.choice(reminders)
+        return reminders[self.rng.integers(len(reminders))]
+
+# =============================================================================
+# SHARDED EXECUTION ENGINE - One tier-1 shard per worker process
+# =============================================================================
+
+# Per-process shard, created by the pool initializer
+_shard_supply: Optional[NeuralDataSupply] = None
+
+def _init_supply_shard(config: LFMConfig, patterns: Dict[str, Tuple[str, ...]], version: str) -> None:
+    """Worker initializer: build this process's NeuralDataSupply shard"""
+    global _shard_supply
+    _shard_supply = NeuralDataSupply(config)
+    _shard_supply.library = PatternLibrary.from_patterns(patterns, version=version)
+
+SHARD_COUNTERS = ('hits', 'misses', 'collisions',
+                  'prefilter_rejections', 'prefilter_passes', 'prefilter_false_positives')
+
+def _run_supply_shard(queries: List[str], iterations: int) -> Dict[str, int]:
+    """Run TRAINING iterations on the local shard and report counter deltas"""
+    supply = _shard_supply
+    before = supply.counters.snapshot()
+    
+    for _ in range(iterations):
+        supply.fast_supply_batch(queries)
+    
+    after = supply.counters.snapshot()
+    deltas = {name: after[name] - before[name] for name in SHARD_COUNTERS}
+    deltas['operations'] = len(queries) * iterations
+    return deltas
+
+def shard_index(query: str, num_shards: int) -> int:
+    """Stable shard assignment (str hash is salted per process)"""
+    return zlib.crc32(query.encode()) % num_shards
+
+class ShardedSupplyEngine:
+    """Tier-1 supply sharded by query across single-worker processes"""
+    
+    def __init__(self, config: LFMConfig, library: PatternLibrary, num_shards: Optional[int] = None):
+        self.num_shards = num_shards or config.num_workers
+        self.library = library  # Snapshot every shard classifies with
+        
+        # Split the cache capacity so the shards together match one tier 1
+        shard_capacity = -(-config.tier1_cache_size // self.num_shards)
+        shard_config = replace(config, tier1_cache_size=shard_capacity, pattern_library_path=None)
+        
+        # A dedicated pool per shard pins each shard to one process
+        self._pools = [
+            ProcessPoolExecutor(
+                max_workers=1,
+                initializer=_init_supply_shard,
+                initargs=(shard_config, library.patterns, library.version)
+            )
+            for _ in range(self.num_shards)
+        ]
+    
+    def partition(self, queries: List[str]) -> List[List[str]]:
+        """Group queries by owning shard"""
+        shards = [[] for _ in range(self.num_shards)]
+        for query in queries:
+            shards[shard_index(query, self.num_shards)].append(query)
+        return shards
+    
+    def run(self, shards: List[List[str]], iterations: int) -> Dict[str, int]:
+        """Run iterations on every shard in parallel and merge their counters"""
+        futures = [
+            pool.submit(_run_supply_shard, shard_queries, iterations)
+            for pool, shard_queries in zip(self._pools, shards) if shard_queries
+        ]
+        
+        totals = defaultdict(int)
+        for future in futures:
+            for name, value in future.result().items():
+                totals[name] += value
+        return dict(totals)
+    
+    def shutdown(self) -> None:
+        for pool in self._pools:
+            pool.shutdown(wait=True)
 
 # =============================================================================
 # MAIN AI UPGRADE SYSTEM
 # =============================================================================
 
+class QueryResult:
+    """
+    Slotted process_query envelope that reads like the dict it replaces
+    Only the fields set for the result's mode are present as keys.
+    """
+    
+    __slots__ = ('mode', 'supply_data', 'reasoning', 'operations')
+    
+    def __init__(self, mode: str, operations: int, supply_data: Optional[SupplyData] = None,
+                 reasoning: Optional[Dict[str, Any]] = None):
+        self.mode = mode
+        self.supply_data = supply_data
+        self.reasoning = reasoning
+        self.operations = operations
+    
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__ and getattr(self, key) is not None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+    
+    def keys(self) -> Tuple[str, ...]:
+        return tuple(key for key in self.__slots__ if getattr(self, key) is not None)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.keys()}
+    
+    def __repr__(self) -> str:
+        return f"QueryResult({self.as_dict()!r})"
+
 class LFMAIUpgradeSystem:
     """
     Complete LFM AI Upgrade System
@@ -578,6 +2611,11 @@ class LFMAIUpgradeSystem:
     def __init__(self, config: Optional[LFMConfig] = None):
         self.config = config or LFMConfig()
         
+        # Root RNG and independent child streams per component
+        self.seed_sequence = np.random.SeedSequence(self.config.seed)
+        executive_seed, humility_seed, system_seed, self.monitor_seed = self.seed_sequence.spawn(4)
+        self.rng = np.random.default_rng(system_seed)
+        
         # Initialize all components
         logger.info("Initializing LFM AI Upgrade System V3.0...")
         
@@ -588,45 +2626,82 @@ class LFMAIUpgradeSystem:
         
         # Two-tier architecture
         self.tier1_supply = NeuralDataSupply(self.config)
-        self.tier2_executive = LFMExecutiveReasoning(self.physics, self.ai_axioms, self.math)
+        self.tier2_executive = LFMExecutiveReasoning(
+            self.physics, self.ai_axioms, self.math, seed=executive_seed,
+            history_size=self.config.tier2_buffer_size,
+            history_spill_path=self.config.tier2_history_spill_path
+        )
         
         # Humility engine
-        self.humility = EpistemicHumility(self.config)
+        self.humility = EpistemicHumility(self.config, rng=np.random.default_rng(humility_seed))
         
         # System state
         self.mode = SystemMode.BALANCED
-        self.operations_count = 0
+        self._operations = 0
+        self._operations_lock = threading.Lock()
         self.start_time = time.time()
         self.performance_history = deque(maxlen=1000)
         
         # Thread pool for parallel processing
         self.executor = ThreadPoolExecutor(max_workers=self.config.num_workers)
         
+        # Process shards, started on first sharded training loop
+        if self.config.execution_engine not in ('thread', 'process'):
+            raise ValueError(
+                f"Unknown execution engine '{self.config.execution_engine}'. "
+                f"Expected 'thread' or 'process'"
+            )
+        self.shard_engine: Optional[ShardedSupplyEngine] = None
+        
         logger.info("System initialization complete")
         logger.info(f"Operating with {self.config.num_workers} workers")
         logger.info(f"Humility reminder: {self.humility.maintain_beginner_mind()}")
     
-    def process_query(self, query: str, mode: Optional[SystemMode] = None) -> Dict[str, Any]:
+    @property
+    def operations_count(self) -> int:
+        return self._operations
+    
+    def _count_operations(self, n: int = 1) -> int:
+        """Add n operations and return the new total in O(1)"""
+        with self._operations_lock:
+            self._operations += n
+            return self._operations
+    
+    def process_query(self, query: str, mode: Optional[SystemMode] = None) -> QueryResult:
         """Main query processing interface"""
-        self.operations_count += 1
         mode = mode or self.mode
         
         # TIER 1: Fast data supply
+        supply_data, fast_result = self._supply_stage(query, mode)
+        if fast_result is not None:
+            return fast_result
+        
+        if mode == SystemMode.CRITICAL:
+            time.sleep(self.config.critical_pause)  # Deliberate pause
+        
+        # TIER 2: Executive reasoning
+        return self._reasoning_stage(query, mode, supply_data)
+    
+    def _supply_stage(self, query: str, mode: SystemMode) -> Tuple[SupplyData, Optional[QueryResult]]:
+        """Tier-1 supply; returns a finished result when no reasoning is needed"""
+        operations = self._count_operations()
         supply_data = self.tier1_supply.fast_supply(query)
         
         if mode == SystemMode.TRAINING:
             # Fast mode - just supply data
-            return {
-                'mode': 'training',
-                'supply_data': supply_data,
-                'operations': self.operations_count
-            }
+            return supply_data, QueryResult('training', operations, supply_data=supply_data)
         
-        elif mode == SystemMode.CRITICAL:
-            # High-quality reasoning mode
-            time.sleep(self.config.critical_pause)  # Deliberate pause
-            reasoning = self.tier2_executive.executive_analysis(query, supply_data)
-            
+        if mode != SystemMode.CRITICAL and supply_data.confidence > self.config.confidence_threshold:
+            # BALANCED mode - confident supply skips reasoning
+            return supply_data, QueryResult('balanced_fast', operations, supply_data=supply_data)
+        
+        return supply_data, None
+    
+    def _reasoning_stage(self, query: str, mode: SystemMode, supply_data: SupplyData) -> QueryResult:
+        """Tier-2 executive reasoning for CRITICAL and low-confidence BALANCED queries"""
+        reasoning = self.tier2_executive.executive_analysis(query, supply_data)
+        
+        if mode == SystemMode.CRITICAL:
             # Add humility check
             uncertainty = self.humility.acknowledge_uncertainty(
                 reasoning['confidence'], query
@@ -634,27 +2709,81 @@ class LFMAIUpgradeSystem:
             if uncertainty:
                 reasoning['uncertainty_note'] = uncertainty
             
+            return QueryResult('critical', self.operations_count, reasoning=reasoning)
+        
+        return QueryResult('balanced_reasoned', self.operations_count, reasoning=reasoning)
+    
+    def process_queries(self, queries: List[str], mode: Optional[SystemMode] = None) -> Dict[str, Any]:
+        """
+        Batch query interface
+        One bulk tier-1 pass returns columnar supply data; queries that need
+        executive reasoning are analysed together in one vectorized call
+        """
+        mode = mode or self.mode
+        supply = self.tier1_supply.fast_supply_batch(queries)
+        self._count_operations(len(queries))
+        
+        if mode == SystemMode.TRAINING:
+            return {
+                'mode': 'training',
+                'supply_data': supply,
+                'operations': self.operations_count
+            }
+        
+        if mode == SystemMode.CRITICAL:
+            time.sleep(self.config.critical_pause)  # One deliberate pause per batch
+            reasoning = self.tier2_executive.executive_analysis_batch(queries, supply)
+            for query, result in zip(queries, reasoning):
+                uncertainty = self.humility.acknowledge_uncertainty(result['confidence'], query)
+                if uncertainty:
+                    result['uncertainty_note'] = uncertainty
             return {
                 'mode': 'critical',
                 'reasoning': reasoning,
                 'operations': self.operations_count
             }
         
-        else:  # BALANCED mode
-            # Adaptive based on confidence
-            if supply_data['confidence'] > self.config.confidence_threshold:
-                return {
-                    'mode': 'balanced_fast',
-                    'supply_data': supply_data,
-                    'operations': self.operations_count
-                }
-            else:
-                reasoning = self.tier2_executive.executive_analysis(query, supply_data)
-                return {
-                    'mode': 'balanced_reasoned',
-                    'reasoning': reasoning,
-                    'operations': self.operations_count
-                }
+        # BALANCED mode - reason only about the low-confidence rows
+        reasoned = supply['confidence'] <= self.config.confidence_threshold
+        rows = np.flatnonzero(reasoned)
+        analyses = self.tier2_executive.executive_analysis_batch(
+            [queries[i] for i in rows],
+            {'domains': [supply['domains'][i] for i in rows], 'confidence': supply['confidence'][rows]}
+        )
+        reasoning: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        for i, result in zip(rows, analyses):
+            reasoning[i] = result
+        
+        return {
+            'mode': 'balanced',
+            'supply_data': supply,
+            'reasoned': reasoned,
+            'reasoning': reasoning,
+            'operations': self.operations_count
+        }
+    
+    def spawn_rngs(self, n: int) -> List[np.random.Generator]:
+        """Independent generators for workers, derived from the system seed"""
+        return [np.random.default_rng(child) for child in self.seed_sequence.spawn(n)]
+    
+    def reload_patterns(self, filepath: Optional[str] = None) -> int:
+        """Swap in a new pattern library while the system keeps serving"""
+        filepath = filepath or self.config.pattern_library_path
+        if not filepath:
+            raise ValueError("No pattern library path given or configured")
+        
+        invalidated = self.tier1_supply.load_patterns(filepath)
+        logger.info(f"Pattern library {self.tier1_supply.library.version} loaded "
+                    f"from {filepath}: {invalidated} cache entries invalidated")
+        self._reset_shard_engine()
+        return invalidated
+    
+    def _reset_shard_engine(self) -> None:
+        """Stop shards holding an old library; they restart on next use"""
+        if self.shard_engine is not None:
+            self.shard_engine.shutdown()
+            self.shard_engine = None
+            logger.info("Tier-1 shard processes stopped for pattern library change")
     
     def training_loop(self, queries: List[str], iterations: int = None) -> Dict:
         """High-speed training using fast supply mode"""
@@ -665,30 +2794,39 @@ class LFMAIUpgradeSystem:
         logger.info(f"Target: {len(queries)} queries × {iterations} iterations")
         
         start_time = time.time()
-        results = []
+        actual_ops = 0
+        
+        # Sharded engine reports back every shard_report_interval iterations
+        sharded = self.config.execution_engine == 'process'
+        step = max(1, self.config.shard_report_interval) if sharded else 1
         
         try:
-            for i in range(iterations):
+            if sharded:
+                if self.shard_engine is not None and self.shard_engine.library is not self.tier1_supply.library:
+                    self._reset_shard_engine()  # Library swapped since the shards started
+                if self.shard_engine is None:
+                    self.shard_engine = ShardedSupplyEngine(self.config, self.tier1_supply.library)
+                    logger.info(f"Started {self.shard_engine.num_shards} tier-1 shard processes")
+                shards = self.shard_engine.partition(queries)
+            
+            for i in range(0, iterations, step):
                 batch_start = time.time()
+                rounds = min(step, iterations - i)
                 
-                # Process batch in parallel
-                futures = []
-                for query in queries:
-                    future = self.executor.submit(
-                        self.process_query, query, SystemMode.TRAINING
-                    )
-                    futures.append(future)
-                
-                # Collect results
-                batch_results = [f.result() for f in futures]
-                results.extend(batch_results)
+                if sharded:
+                    counters = self.shard_engine.run(shards, rounds)
+                    self._merge_shard_counters(counters)
+                else:
+                    # One bulk tier-1 pass per iteration
+                    self.process_queries(queries, SystemMode.TRAINING)
+                actual_ops += len(queries) * rounds
                 
                 # Performance tracking
                 batch_time = time.time() - batch_start
-                batch_rate = len(queries) / batch_time if batch_time > 0 else 0
+                batch_rate = len(queries) * rounds / batch_time if batch_time > 0 else 0
                 self.performance_history.append(batch_rate)
                 
-                if i % 100 == 0:
+                if i % 100 < step:
                     logger.info(f"Iteration {i}: {batch_rate:,.0f} ops/sec")
                 
                 # Check timeout
@@ -701,7 +2839,6 @@ class LFMAIUpgradeSystem:
             logger.error(f"Training loop error: {e}")
         
         total_time = time.time() - start_time
-        actual_ops = len(results)
         
         # Calculate metrics
         metrics = {
@@ -727,6 +2864,12 @@ class LFMAIUpgradeSystem:
         
         return metrics
     
+    def _merge_shard_counters(self, counters: Dict[str, int]) -> None:
+        """Fold shard counter reports into the system-wide totals"""
+        self._count_operations(counters.get('operations', 0))
+        for name in SHARD_COUNTERS:
+            self.tier1_supply.counters.incr(name, counters.get(name, 0))
+    
     def critical_reasoning_batch(self, queries: List[str]) -> List[Dict]:
         """Process important queries with full executive reasoning"""
         logger.info(f"Critical reasoning mode: {len(queries)} queries")
@@ -744,24 +2887,100 @@ class LFMAIUpgradeSystem:
         
         return results
     
-    def generate_physics_predictions(self, k_range: Tuple[int, int] = (0, 204)) -> Dict:
-        """Generate physics predictions across scales"""
-        predictions = {}
-        
-        for k in range(k_range[0], k_range[1] + 1):
-            pressure = self.math.pressure_scale(k)
-            length = self.math.length_scale(k)
-            field_amp = self.math.field_amplitude(k)
-            
-            predictions[k] = {
-                'scale': k,
-                'pressure_Pa': pressure,
-                'length_m': length,
-                'field_amplitude': field_amp,
-                'matter_possible': k >= 66
+    def generate_physics_predictions(self, k_range: Tuple[float, float] = (0, 204),
+                                     step: Optional[float] = None, output: str = 'dict',
+                                     dtype: Any = np.float64, log_space: bool = False) -> Any:
+        """
+        Generate physics predictions across scales
+        output='dict' keeps the {k: {...}} form for integer k; 'columns'
+        returns a dict of arrays and 'structured' a NumPy record array,
+        both computed with one vectorized sweep over the k grid
+        """
+        if output == 'dict':
+            if step is not None or dtype is not np.float64 or log_space:
+                raise ValueError("output='dict' supports only the integer float64 sweep")
+            columns = self._prediction_chunk(np.arange(k_range[0], k_range[1] + 1), np.float64, False)
+            keys = [name for name in columns if name != 'k']
+            rows = zip(*(columns[name].tolist() for name in keys))
+            return {
+                k: {'scale': k, **dict(zip(keys, row))}
+                for k, row in zip(columns['k'].tolist(), rows)
             }
         
-        return predictions
+        k = self._prediction_grid(k_range, step, 0, self._prediction_count(k_range, step))
+        columns = self._prediction_chunk(k, dtype, log_space)
+        
+        if output == 'columns':
+            return columns
+        if output == 'structured':
+            table = np.empty(len(k), dtype=[(name, col.dtype) for name, col in columns.items()])
+            for name, col in columns.items():
+                table[name] = col
+            return table
+        raise ValueError(f"Unknown output '{output}'. Expected 'dict', 'columns' or 'structured'")
+    
+    def iter_physics_predictions(self, k_range: Tuple[float, float], step: Optional[float] = None,
+                                 chunk_size: int = 1_000_000, dtype: Any = np.float64,
+                                 log_space: bool = False):
+        """Lazily yield column chunks of a sweep too large to hold at once"""
+        total = self._prediction_count(k_range, step)
+        for start in range(0, total, chunk_size):
+            stop = min(start + chunk_size, total)
+            k = self._prediction_grid(k_range, step, start, stop)
+            yield self._prediction_chunk(k, dtype, log_space)
+    
+    def stream_physics_predictions(self, filepath: str, k_range: Tuple[float, float],
+                                   step: Optional[float] = None, chunk_size: int = 1_000_000,
+                                   dtype: Any = np.float64, log_space: bool = False) -> np.memmap:
+        """
+        Write a prediction sweep into a memmap file chunk by chunk
+        Rerunning with the same arguments and constants resumes an
+        interrupted sweep; the returned read-only memmap is a zero-copy view of the file
+        """
+        total = self._prediction_count(k_range, step)
+        probe = self._prediction_chunk(self._prediction_grid(k_range, step, 0, 1), dtype, log_space)
+        meta = {
+            'kind': 'physics_predictions',
+            'k_range': [float(k_range[0]), float(k_range[1])],
+            'step': step,
+            'log_space': log_space,
+            'log_base': 10 if log_space else None,
+            'dtype': np.dtype(dtype).name,
+            **self.math.sweep_constants()
+        }
+        sweep = MemmapSweep(filepath, [(name, col.dtype) for name, col in probe.items()], total, meta)
+        
+        for start, stop in sweep.pending_chunks(chunk_size):
+            columns = self._prediction_chunk(
+                self._prediction_grid(k_range, step, start, stop), dtype, log_space
+            )
+            rows = sweep.rows[start:stop]
+            for name, col in columns.items():
+                rows[name] = col
+            sweep.commit(stop)
+        
+        return MemmapSweep.open(filepath)
+    
+    @staticmethod
+    def _prediction_count(k_range: Tuple[float, float], step: Optional[float]) -> int:
+        if step is None:
+            return int(k_range[1]) - int(k_range[0]) + 1
+        if step <= 0:
+            raise ValueError(f"step must be positive, got {step}")
+        return int(np.floor((k_range[1] - k_range[0]) / step + 1e-9)) + 1
+    
+    @staticmethod
+    def _prediction_grid(k_range: Tuple[float, float], step: Optional[float], start: int, stop: int) -> np.ndarray:
+        """Grid points start..stop-1 without materializing the whole sweep"""
+        if step is None:
+            return np.arange(int(k_range[0]) + start, int(k_range[0]) + stop)
+        return k_range[0] + np.arange(start, stop) * step
+    
+    def _prediction_chunk(self, k: np.ndarray, dtype: Any, log_space: bool) -> Dict[str, np.ndarray]:
+        columns = {'k': k}
+        columns.update(self.math.scale_columns(k, dtype=dtype, log_space=log_space))
+        columns['matter_possible'] = k >= 66
+        return columns
     
     def system_diagnostics(self) -> Dict:
         """Complete system health and performance diagnostics"""
@@ -779,6 +2998,14 @@ class LFMAIUpgradeSystem:
             'ai_axioms': dict(self.ai_axioms.axiom_applications),
             'neural_tier1': {
                 'cache_size': len(self.tier1_supply.cache),
+                **self.tier1_supply.cache.stats(),
+                'key_strategy': self.tier1_supply.key_strategy,
+                'collisions': self.tier1_supply.collisions,
+                'pattern_version': self.tier1_supply.library.version,
+                'pattern_keywords': self.tier1_supply.library.keyword_count,
+                'registered_domains': len(DOMAIN_REGISTRY),
+                'prefilter': self.tier1_supply.prefilter_stats(),
+                'invalidations': self.tier1_supply.invalidations,
                 'hit_rate': self.tier1_supply.hits / (self.tier1_supply.hits + self.tier1_supply.misses)
                            if (self.tier1_supply.hits + self.tier1_supply.misses) > 0 else 0,
                 'total_queries': self.tier1_supply.hits + self.tier1_supply.misses
@@ -786,7 +3013,8 @@ class LFMAIUpgradeSystem:
             'executive_tier2': {
                 'reasoning_count': self.tier2_executive.reasoning_count,
                 'relational_operations': self.tier2_executive.math.operation_count,
-                'decision_history_size': len(self.tier2_executive.decision_history)
+                'decision_history_size': len(self.tier2_executive.decision_history),
+                'confidence_variance': self.tier2_executive.confidence_stats.variance
             },
             'humility': {
                 'uncertainty_acknowledgments': self.humility.uncertainty_acknowledgments,
@@ -822,6 +3050,8 @@ class LFMAIUpgradeSystem:
         """Clean shutdown"""
         logger.info("Shutting down LFM AI Upgrade System...")
         self.executor.shutdown(wait=True)
+        if self.shard_engine is not None:
+            self.shard_engine.shutdown()
         
         # Final diagnostics
         final_diagnostics = self.system_diagnostics()
@@ -834,10 +3064,352 @@ class LFMAIUpgradeSystem:
         
         logger.info("Shutdown complete")
 
+# =============================================================================
+# ASYNCIO FRONT-END
+# =============================================================================
+
+class BackpressureError(RuntimeError):
+    """Raised when the async front-end has no free reasoning slot"""
+
+class AsyncLFMSystem:
+    """
+    asyncio wrapper around LFMAIUpgradeSystem
+    Tier-1 hits are answered inline, executive reasoning runs on a bounded
+    thread pool and the CRITICAL pause never blocks the event loop
+    """
+    
+    def __init__(self, system: Optional[LFMAIUpgradeSystem] = None,
+                 max_pending: Optional[int] = None, reasoning_workers: Optional[int] = None):
+        self.system = system or LFMAIUpgradeSystem()
+        config = self.system.config
+        self.max_pending = max_pending or config.async_max_pending
+        self.acquire_timeout = config.async_acquire_timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=reasoning_workers or config.async_reasoning_workers,
+            thread_name_prefix='lfm-reasoning'
+        )
+        self._slots: Optional[asyncio.Semaphore] = None  # Created inside the running loop
+        self.pending = 0  # Requests currently holding a reasoning slot
+        self.rejected = 0
+    
+    async def process_query(self, query: str, mode: Optional[SystemMode] = None) -> QueryResult:
+        """Awaitable process_query with backpressure and cancellation"""
+        system = self.system
+        mode = mode or system.mode
+        
+        supply_data, fast_result = system._supply_stage(query, mode)
+        if fast_result is not None:
+            return fast_result
+        
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        if self._slots.locked():
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.acquire_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise BackpressureError(
+                    f"{self.max_pending} reasoning requests already pending"
+                ) from None
+        else:
+            await self._slots.acquire()
+        self.pending += 1
+        
+        # Cancellation at either await releases the slot; a queued
+        # reasoning job is cancelled with its future
+        try:
+            if mode == SystemMode.CRITICAL:
+                await asyncio.sleep(system.config.critical_pause)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._pool, system._reasoning_stage, query, mode, supply_data
+            )
+        finally:
+            self.pending -= 1
+            self._slots.release()
+    
+    async def process_queries(self, queries: List[str], mode: Optional[SystemMode] = None) -> List[QueryResult]:
+        """Process queries concurrently, preserving order"""
+        return await asyncio.gather(*(self.process_query(q, mode) for q in queries))
+    
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+    
+    async def __aenter__(self) -> 'AsyncLFMSystem':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
 # =============================================================================
 # DEMONSTRATION AND TESTING
 # =============================================================================
 
+def benchmark_batch_processing(system: LFMAIUpgradeSystem, queries: List[str],
+                               iterations: int = 100) -> Dict[str, float]:
+    """Compare TRAINING throughput of the per-query and batch paths"""
+    total = len(queries) * iterations
+    rates = {}
+    
+    # Per-query path through the thread pool
+    start = time.perf_counter()
+    for _ in range(iterations):
+        futures = [system.executor.submit(system.process_query, q, SystemMode.TRAINING)
+                   for q in queries]
+        for f in futures:
+            f.result()
+    rates['threaded_per_query'] = total / (time.perf_counter() - start)
+    
+    # Per-query path in a plain loop
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for q in queries:
+            system.process_query(q, SystemMode.TRAINING)
+    rates['per_query'] = total / (time.perf_counter() - start)
+    
+    # Batch path
+    start = time.perf_counter()
+    for _ in range(iterations):
+        system.process_queries(queries, SystemMode.TRAINING)
+    rates['batch'] = total / (time.perf_counter() - start)
+    
+    rates['batch_speedup'] = rates['batch'] / rates['threaded_per_query']
+    return rates
+
+def benchmark_memory(num_queries: int = 5000) -> Dict[str, float]:
+    """Bytes per cached tier-1 entry and per retained process_query result"""
+    import gc
+    import tracemalloc
+    
+    system = LFMAIUpgradeSystem(LFMConfig(tier1_cache_size=num_queries, seed=0))
+    queries = [f"quantum momentum query {i}" for i in range(num_queries)]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        # Cache fill: every query misses once
+        base = tracemalloc.get_traced_memory()[0]
+        for q in queries:
+            system.tier1_supply.fast_supply(q)
+        per_entry = (tracemalloc.get_traced_memory()[0] - base) / num_queries
+        
+        # Results kept alive by the caller, all cache hits
+        results = []
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        base = tracemalloc.get_traced_memory()[0]
+        for q in queries:
+            results.append(system.process_query(q, SystemMode.TRAINING))
+        per_result = (tracemalloc.get_traced_memory()[0] - base) / num_queries
+        blocks = sum(s.count_diff for s in tracemalloc.take_snapshot().compare_to(before, 'filename'))
+    finally:
+        tracemalloc.stop()
+        system.shutdown()
+    
+    return {
+        'bytes_per_cache_entry': per_entry,
+        'bytes_per_result': per_result,
+        'allocations_per_query': blocks / num_queries
+    }
+
+def run_counter_stress_test(num_threads: int = 16, queries_per_thread: int = 5000) -> Dict[str, Any]:
+    """Hammer shared counters from many threads and check for exact totals"""
+    system = LFMAIUpgradeSystem(LFMConfig(num_workers=num_threads))
+    queries = [f"stress {i} momentum" for i in range(64)]
+    state = np.ones(2)
+    barrier = threading.Barrier(num_threads)
+    
+    def worker():
+        barrier.wait()
+        for i in range(queries_per_thread):
+            system.process_query(queries[i % len(queries)], SystemMode.TRAINING)
+            system.physics.conservation(state, state)
+            system.ai_axioms.universality()
+            system.math.relational_product(0.5, 0.5)
+    
+    futures = [system.executor.submit(worker) for _ in range(num_threads)]
+    for f in futures:
+        f.result()
+    system.executor.shutdown(wait=True)
+    
+    expected = num_threads * queries_per_thread
+    observed = {
+        'operations': system.operations_count,
+        'tier1_queries': system.tier1_supply.hits + system.tier1_supply.misses,
+        'conservation': system.physics.axiom_calls['conservation'],
+        'universality': system.ai_axioms.axiom_applications['universality'],
+        'relational_operations': system.math.operation_count
+    }
+    return {
+        'threads': num_threads,
+        'expected': expected,
+        'observed': observed,
+        'exact': all(v == expected for v in observed.values())
+    }
+
+def run_cache_eviction_check() -> Dict[str, Any]:
+    """Replay a fixed LFU workload with discards and check the eviction order"""
+    cache = LFUCache(3)
+    evicted = []
+    
+    def put(key):
+        before = {k for k, _ in cache.items()}
+        cache.put(key, key)
+        evicted.extend(sorted(before - {k for k, _ in cache.items()}))
+    
+    for key in 'abc':
+        put(key)
+    for key in 'aab':
+        cache.get(key)  # Frequencies a=3, b=2, c=1
+    cache.discard('c')
+    put('d')
+    put('e')  # Evicts d, the only frequency-1 entry
+    cache.get('e')  # b and e tie at 2; b is least recently used
+    put('f')
+    cache.discard('a')
+    put('g')
+    put('h')  # Evicts f, the older of the frequency-1 entries
+    
+    expected = ['d', 'b', 'f']
+    survivors = sorted(k for k, _ in cache.items())
+    return {
+        'policy': cache.policy,
+        'expected': expected,
+        'observed': evicted,
+        'survivors': survivors,
+        'exact': evicted == expected and survivors == ['e', 'g', 'h'] and cache.evictions == len(expected)
+    }
+
+def run_matcher_check(num_texts: int = 2000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Compare PatternLibrary.match_mask against naive substring search
+    Short overlapping keywords over a small alphabet exercise the failure
+    links; the library is checked with a delta automaton and after the
+    delta is folded back into the main one.
+    """
+    rng = np.random.default_rng(seed)
+    alphabet = np.array(list('abcdemnortu '))
+    
+    def words(count, low, high):
+        return [''.join(rng.choice(alphabet[:-1], rng.integers(low, high))) for _ in range(count)]
+    
+    texts = [''.join(rng.choice(alphabet, 40)) for _ in range(num_texts)]
+    texts += ['momentum contract market protein memory', '']
+    
+    def mismatches(library):
+        bits = {domain: DOMAIN_REGISTRY.bit(domain) for domain in library.patterns}
+        bad = 0
+        for text in texts:
+            naive = 0
+            for domain, keywords in library.patterns.items():
+                if any(kw in text for kw in keywords):
+                    naive |= bits[domain]
+            bad += library.match_mask(text) != naive
+        return bad
+    
+    library = PatternLibrary.from_patterns(DEFAULT_PATTERNS)
+    with_delta = library.with_domain('physics', words(8, 2, 5)).with_domain('legal', words(8, 2, 5))
+    folded = with_delta.with_domain('economic', words(PatternLibrary.DELTA_MIN + 1, 2, 6))
+    
+    observed = {
+        'main': mismatches(library),
+        'delta': mismatches(with_delta),
+        'folded': mismatches(folded)
+    }
+    return {
+        'texts': len(texts),
+        'delta_used': with_delta.delta is not None,
+        'delta_folded': folded.delta is None,
+        'mismatches': observed,
+        'exact': with_delta.delta is not None and folded.delta is None and not any(observed.values())
+    }
+
+def run_invalidation_check() -> Dict[str, Any]:
+    """Swap pattern libraries and check that only affected cache entries are dropped"""
+    supply = NeuralDataSupply(LFMConfig(tier1_cache_size=100))
+    queries = [
+        "Quark confinement in the nucleus", "market equilibrium under quarkonium demand",
+        "Contract law precedent", "Market supply shocks", "protein folding energy",
+        "Attention and memory", "unrelated query text"
+    ]
+    
+    def cached():
+        return {data.query for _, data in supply.cache.items()}
+    
+    def expect(keyword):
+        return {q for q in cached() if keyword in q.lower()}
+    
+    steps = []
+    for q in queries:
+        supply.fast_supply(q)
+    
+    # Added keyword: only queries containing it can reclassify
+    stale = expect('quark')
+    invalidated = supply.add_domain('physics', ['quark'])
+    steps.append(('add quark', len(stale), invalidated, not (stale & cached())))
+    
+    # Removed keyword: same rule
+    patterns = {domain: list(keywords) for domain, keywords in supply.patterns.items()}
+    patterns['economic'].remove('market')
+    stale = expect('market')
+    invalidated = supply.swap_library(PatternLibrary.from_patterns(patterns, version='no-market'))
+    steps.append(('remove market', len(stale), invalidated, not (stale & cached())))
+    
+    # Unchanged keywords: nothing is dropped
+    invalidated = supply.swap_library(PatternLibrary.from_patterns(patterns, version='same'))
+    steps.append(('no change', 0, invalidated, True))
+    
+    survivors = cached()
+    untouched = {q for q in queries if 'quark' not in q.lower() and 'market' not in q.lower()}
+    reclassified = supply.fast_supply(queries[0]).domains
+    return {
+        'steps': steps,
+        'survivors': len(survivors),
+        'exact': (all(expected == got and gone for _, expected, got, gone in steps)
+                  and survivors == untouched and 'physics' in reclassified)
+    }
+
+def run_rolling_stats_check(window: int = 64, turns: int = 5, seed: int = 0) -> Dict[str, Any]:
+    """
+    Compare RollingStats against np.mean/np.var of the trailing window
+    Values sit on an offset so cancellation would show up, and the run
+    spans several turns of the ring, fed both one value and one chunk at
+    a time. The batch stability flags are checked against np.var too.
+    """
+    rng = np.random.default_rng(seed)
+    values = 1e3 + rng.standard_normal(window * turns) * np.linspace(0.1, 2.0, window * turns)
+    
+    scalar, chunked = RollingStats(window), RollingStats(window)
+    worst_mean = worst_var = 0.0
+    order_ok = True
+    start = 0
+    for end in range(1, len(values) + 1):
+        scalar.push(values[end - 1])
+        if end % 7 == 0 or end == len(values):
+            chunked.extend(values[start:end])
+            start = end
+        expected = values[max(end - window, 0):end]
+        checked = (scalar, chunked) if start == end else (scalar,)
+        for stats in checked:
+            worst_mean = max(worst_mean, abs(stats.mean - expected.mean()))
+            worst_var = max(worst_var, abs(stats.variance - expected.var()) / max(expected.var(), 1e-12))
+            order_ok &= np.array_equal(stats.values(), expected)
+    
+    # Stability flags for a batch arriving after the first `window` values
+    history, batch = values[:window], values[window:]
+    flags = LFMExecutiveReasoning._rolling_stability(history, batch, window)
+    trailing = np.concatenate([history, batch])
+    expected_flags = [bool(np.var(trailing[max(i - window, 0):i]) < 1.0)
+                      for i in range(window, len(trailing))]
+    flags_ok = flags == expected_flags and all(type(f) is bool for f in flags)
+    
+    return {
+        'window': window,
+        'values': len(values),
+        'max_mean_error': float(worst_mean),
+        'max_variance_rel_error': float(worst_var),
+        'exact': worst_mean < 1e-9 and worst_var < 1e-6 and order_ok and flags_ok
+    }
+
 def run_comprehensive_test():
     """Run comprehensive system test"""
     print("="*80)
@@ -909,6 +3481,73 @@ def run_comprehensive_test():
     print(f"   {diagnostics['humility']['reminder']}")
     print()
     
+    print("6. BATCH BENCHMARK (TRAINING mode)")
+    print("-" * 40)
+    rates = benchmark_batch_processing(system, test_queries, iterations=200)
+    print(f"   Threaded per-query: {rates['threaded_per_query']:,.0f} ops/sec")
+    print(f"   Plain per-query:    {rates['per_query']:,.0f} ops/sec")
+    print(f"   Batch:              {rates['batch']:,.0f} ops/sec "
+          f"({rates['batch_speedup']:.1f}x)")
+    print()
+    
+    print("7. MEMORY FOOTPRINT")
+    print("-" * 40)
+    memory = benchmark_memory()
+    print(f"   Bytes per cache entry:   {memory['bytes_per_cache_entry']:.0f}")
+    print(f"   Bytes per result:        {memory['bytes_per_result']:.0f}")
+    print(f"   Allocations per query:   {memory['allocations_per_query']:.2f}")
+    print()
+    
+    print("8. COUNTER STRESS TEST")
+    print("-" * 40)
+    stress = run_counter_stress_test()
+    print(f"   Threads: {stress['threads']}, expected {stress['expected']:,} per counter")
+    for name, observed in stress['observed'].items():
+        print(f"   {name}: {observed:,}")
+    if not stress['exact']:
+        raise RuntimeError(f"Counter totals are not exact under {stress['threads']} threads: {stress['observed']}")
+    print("   All totals exact")
+    print()
+    
+    print("9. CACHE EVICTION CHECK")
+    print("-" * 40)
+    eviction = run_cache_eviction_check()
+    print(f"   {eviction['policy'].upper()} evictions: {eviction['observed']} (expected {eviction['expected']})")
+    if not eviction['exact']:
+        raise RuntimeError(f"{eviction['policy'].upper()} eviction order is wrong: {eviction}")
+    print(f"   Survivors: {eviction['survivors']}")
+    print()
+    
+    print("10. MATCHER CHECK")
+    print("-" * 40)
+    matching = run_matcher_check()
+    print(f"   Texts: {matching['texts']:,}, mismatches vs substring search: {matching['mismatches']}")
+    if not matching['exact']:
+        raise RuntimeError(f"Keyword automaton disagrees with substring search: {matching}")
+    print("   Main, delta and folded automata all agree")
+    print()
+    
+    print("11. CACHE INVALIDATION CHECK")
+    print("-" * 40)
+    invalidation = run_invalidation_check()
+    for step, expected, invalidated, _ in invalidation['steps']:
+        print(f"   {step}: {invalidated} invalidated (expected {expected})")
+    if not invalidation['exact']:
+        raise RuntimeError(f"Library swap invalidated the wrong cache entries: {invalidation}")
+    print(f"   Untouched entries kept: {invalidation['survivors']}")
+    print()
+    
+    print("12. ROLLING STATS CHECK")
+    print("-" * 40)
+    rolling = run_rolling_stats_check()
+    print(f"   Window {rolling['window']}, {rolling['values']} values")
+    print(f"   Max mean error:              {rolling['max_mean_error']:.2e}")
+    print(f"   Max variance relative error: {rolling['max_variance_rel_error']:.2e}")
+    if not rolling['exact']:
+        raise RuntimeError(f"RollingStats disagrees with np.var: {rolling}")
+    print("   Matches np.mean/np.var across ring wraps")
+    print()
+    
     # Shutdown
     system.shutdown()
     
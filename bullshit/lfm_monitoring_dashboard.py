@@ -18,9 +18,15 @@ from typing import Dict, List, Optional
 class LFMMonitoringDashboard:
     """Real-time monitoring dashboard for LFM AI Upgrade System"""
     
-    def __init__(self, system=None, update_interval=1.0):
+    def __init__(self, system=None, update_interval=1.0, seed=None):
         self.system = system
         self.update_interval = update_interval
+        
+        # Own random stream; follows the system seed when attached. Spawned
+        # from the system's monitor slot so spawn_rngs() is unaffected
+        if seed is None and getattr(system, 'monitor_seed', None) is not None:
+            seed = system.monitor_seed.spawn(1)[0]
+        self.rng = np.random.default_rng(seed)
         self.running = False
         self.monitor_thread = None
         
@@ -97,15 +103,17 @@ class LFMMonitoringDashboard:
             }
         else:
             # Demo metrics if no system attached
+            rates = self.rng.uniform([50000, 0.75], [150000, 0.95])
+            counts = self.rng.integers([100, 200, 10, 0], [1000, 2000, 100, 20])
             metrics = {
                 'timestamp': datetime.now(),
-                'operations_rate': np.random.uniform(50000, 150000),
-                'cache_hit_rate': np.random.uniform(0.75, 0.95),
+                'operations_rate': float(rates[0]),
+                'cache_hit_rate': float(rates[1]),
                 'total_operations': int(time.time() * 1000) % 1000000,
-                'physics_axioms': np.random.randint(100, 1000),
-                'ai_axioms': np.random.randint(200, 2000),
-                'reasoning_count': np.random.randint(10, 100),
-                'uncertainty_acks': np.random.randint(0, 20)
+                'physics_axioms': int(counts[0]),
+                'ai_axioms': int(counts[1]),
+                'reasoning_count': int(counts[2]),
+                'uncertainty_acks': int(counts[3])
             }
         
         return metrics
@@ -288,7 +296,7 @@ class LFMMonitoringDashboard:
             "Maintain infinite curiosity",
             "Never stop improving"
         ]
-        print(f"  \"{np.random.choice(reminders)}\"")
+        print(f"  \"{reminders[self.rng.integers(len(reminders))]}\"")
         print()
         print("="*80)
     